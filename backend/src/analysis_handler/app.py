@@ -1,31 +1,79 @@
 import json
+import concurrent.futures
+import time
 import boto3
 from datetime import datetime
 import os
 from botocore.exceptions import ClientError
+from boto3.dynamodb.types import TypeDeserializer
 import logging
 from decimal import Decimal
 
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # Initialize AWS clients
-region = boto3.Session().region_name or 'ap-south-1'
+# Lambda sets AWS_REGION; reading it avoids a config-chain walk at cold start
+region = os.environ.get('AWS_REGION', 'ap-south-1')
 dynamodb = boto3.resource('dynamodb', region_name=region)
 
+# Low-level client + deserializer for the bulk read paths
+_ddb_client = dynamodb.meta.client
+_deserializer = TypeDeserializer()
+
 # Environment variables
 CANDIDATES_TABLE = os.environ['CANDIDATES_TABLE']
 ANALYSES_TABLE = os.environ['ANALYSES_TABLE']
 
+# type-updatedAt-index is safe to serve list reads only after every
+# pre-migration row has been stamped with _type; operators flip this once
+# the backfill has run
+_TYPE_INDEX_BACKFILLED = os.environ.get('TYPE_INDEX_BACKFILLED', '').lower() in ('1', 'true', 'yes')
+
+# Table handles are created once per container so warm invocations reuse them
+CANDIDATES_TBL = dynamodb.Table(CANDIDATES_TABLE)
+ANALYSES_TBL = dynamodb.Table(ANALYSES_TABLE)
+
+# Short-lived candidate cache: the frontend polls the same candidate every few
+# seconds while processing, so warm containers can skip the repeat get_item
+_CAND_CACHE_TTL = 5.0
+_cand_cache = {}
+
+def get_candidate_cached(candidate_id):
+    """Fetch a candidate record, reusing a warm-container cache for a few seconds"""
+    now = time.monotonic()
+    entry = _cand_cache.get(candidate_id)
+    if entry is not None and now - entry[0] < _CAND_CACHE_TTL:
+        return entry[1]
+    candidate = CANDIDATES_TBL.get_item(Key={'candidateId': candidate_id}).get('Item', {})
+    _cand_cache[candidate_id] = (now, candidate)
+    return candidate
+
+# CORS headers are identical for every response; build them once
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Content-Type': 'application/json'
+}
+OPTIONS_RESPONSE = {'statusCode': 200, 'headers': CORS_HEADERS, 'body': '{}'}
+
 def lambda_handler(event, context):
     """Retrieve and format analysis results for frontend"""
     try:
         # Handle CORS preflight request
         if event.get('httpMethod') == 'OPTIONS':
-            return create_cors_response(200, {})
+            return OPTIONS_RESPONSE
         
-        logger.info(f"Analysis handler invoked with event: {json.dumps(event)}")
+        # Full event only at DEBUG; %s defers serialization until a sink wants it
+        logger.debug("Analysis handler invoked with event: %s", event)
         
         # Get query parameters
         query_params = event.get('queryStringParameters') or {}
@@ -43,17 +91,15 @@ def lambda_handler(event, context):
             analyses_data = get_all_analyses()
             return create_cors_response(200, {'analyses': analyses_data})
         
-                        except Exception as e:
+    except Exception as e:
         logger.error(f"Error in analysis handler: {str(e)}")
         return create_cors_response(500, {'error': str(e)})
 
 def get_candidate_analysis(candidate_id):
     """Get analysis data for a specific candidate"""
     try:
-        analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        
         # Query analysis by candidate ID
-        response = analyses_table.query(
+        response = ANALYSES_TBL.query(
             IndexName='candidateId-index',
             KeyConditionExpression='candidateId = :candidate_id',
             ExpressionAttributeValues={':candidate_id': candidate_id}
@@ -65,9 +111,7 @@ def get_candidate_analysis(candidate_id):
         analysis_record = response['Items'][0]
         
         # Get candidate info
-        candidates_table = dynamodb.Table(CANDIDATES_TABLE)
-        candidate_response = candidates_table.get_item(Key={'candidateId': candidate_id})
-        candidate_data = candidate_response.get('Item', {})
+        candidate_data = get_candidate_cached(candidate_id)
         
         # Format response with real data from uploaded resume
         formatted_analysis = {
@@ -99,29 +143,112 @@ def get_candidate_analysis(candidate_id):
         logger.error(f"Error getting candidate analysis: {str(e)}")
         return None
 
+def scan_all_items(table, **scan_kwargs):
+    """Scan a table page by page, yielding items beyond DynamoDB's 1 MB page limit
+
+    Bulk scans go through the low-level client with one explicit
+    TypeDeserializer pass per item, skipping the per-call overhead of the
+    resource-layer wrappers.
+    """
+    scan_kwargs['TableName'] = table.name
+    while True:
+        response = _ddb_client.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            yield {k: _deserializer.deserialize(v) for k, v in item.items()}
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+# Parallel scans only pay off once a table is past a few thousand items
+_PARALLEL_SCAN_MIN_ITEMS = 5000
+_PARALLEL_SCAN_SEGMENTS = 4
+
+def _scan_segment(table, segment, scan_kwargs):
+    return list(scan_all_items(
+        table, Segment=segment, TotalSegments=_PARALLEL_SCAN_SEGMENTS, **scan_kwargs
+    ))
+
+def scan_table_fast(table, **scan_kwargs):
+    """Scan a whole table, splitting into parallel segments when it is large
+
+    item_count comes from DescribeTable (cached on the Table object) and is
+    approximate, which is fine for a threshold check.
+    """
+    if (table.item_count or 0) < _PARALLEL_SCAN_MIN_ITEMS:
+        return list(scan_all_items(table, **scan_kwargs))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_PARALLEL_SCAN_SEGMENTS) as executor:
+        futures = [
+            executor.submit(_scan_segment, table, segment, dict(scan_kwargs))
+            for segment in range(_PARALLEL_SCAN_SEGMENTS)
+        ]
+        items = []
+        for future in futures:
+            items.extend(future.result())
+    return items
+
+# The list endpoint never renders extractedText, so keep it out of the wire
+# format entirely
+_ANALYSIS_SUMMARY_PROJECTION = 'analysisId,candidateId,#s,textExtractionStatus,overallScore,skills,createdAt,updatedAt'
+
+def query_all_items(table, **query_kwargs):
+    """Query page by page, yielding items across pagination boundaries"""
+    while True:
+        response = table.query(**query_kwargs)
+        yield from response.get('Items', [])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        query_kwargs['ExclusiveStartKey'] = last_key
+
+def fetch_analyses_newest_first():
+    """Read analyses newest-first from type-updatedAt-index, scanning as fallback
+
+    Returns (items, presorted); presorted is False when the scan path ran and
+    the caller still has to sort. The index only holds rows stamped with
+    _type, so it is trusted only once the backfill flag says every
+    pre-migration row has been stamped — a non-empty but partial index would
+    silently drop the older analyses.
+    """
+    if _TYPE_INDEX_BACKFILLED:
+        try:
+            items = list(query_all_items(
+                ANALYSES_TBL,
+                IndexName='type-updatedAt-index',
+                KeyConditionExpression='#t = :t',
+                ProjectionExpression=_ANALYSIS_SUMMARY_PROJECTION,
+                ExpressionAttributeNames={'#t': '_type', '#s': 'status'},
+                ExpressionAttributeValues={':t': 'analysis'},
+                ScanIndexForward=False
+            ))
+            if items:
+                return items, True
+        except ClientError as e:
+            logger.warning(f"type-updatedAt-index unavailable, falling back to scan: {str(e)}")
+    return scan_table_fast(
+        ANALYSES_TBL,
+        ProjectionExpression=_ANALYSIS_SUMMARY_PROJECTION,
+        ExpressionAttributeNames={'#s': 'status'}
+    ), False
+
 def get_all_analyses():
     """Get all analysis records"""
     try:
-        analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        
-        # Scan all analyses
-        response = analyses_table.scan()
-        analyses = response.get('Items', [])
+        # Range-read newest-first off the GSI; avoids full scan + Python sort
+        analyses, presorted = fetch_analyses_newest_first()
         
-        # Format each analysis
-        formatted_analyses = []
-        for analysis in analyses:
-            candidate_id = analysis.get('candidateId')
-            
-            # Get candidate info
-            candidates_table = dynamodb.Table(CANDIDATES_TABLE)
-            candidate_response = candidates_table.get_item(Key={'candidateId': candidate_id})
-            candidate_data = candidate_response.get('Item', {})
-            
-            formatted_analysis = {
+        # Fetch all referenced candidates in one batch instead of one get_item per analysis
+        candidate_ids = list({a['candidateId'] for a in analyses if a.get('candidateId')})
+        candidates_by_id = batch_get_candidates(candidate_ids)
+
+        # Single-pass join: one shared empty dict for misses, one comprehension
+        # instead of a build-then-append loop
+        _empty = {}
+        formatted_analyses = [
+            {
                 'analysisId': analysis.get('analysisId'),
-            'candidateId': candidate_id,
-                'candidateName': candidate_data.get('name', 'Unknown'),
+                'candidateId': (candidate_id := analysis.get('candidateId')),
+                'candidateName': (candidate_data := candidates_by_id.get(candidate_id, _empty)).get('name', 'Unknown'),
                 'candidateEmail': candidate_data.get('email', 'Unknown'),
                 'fileName': candidate_data.get('fileName', 'Unknown'),
                 'uploadedAt': candidate_data.get('uploadedAt'),
@@ -132,10 +259,12 @@ def get_all_analyses():
                 'createdAt': analysis.get('createdAt'),
                 'updatedAt': analysis.get('updatedAt')
             }
-            formatted_analyses.append(formatted_analysis)
+            for analysis in analyses
+        ]
         
-        # Sort by updated date (newest first)
-        formatted_analyses.sort(key=lambda x: x.get('updatedAt', ''), reverse=True)
+        if not presorted:
+            # Scan fallback returns unordered items; sort newest first
+            formatted_analyses.sort(key=lambda x: x.get('updatedAt', ''), reverse=True)
         
         logger.info(f"Retrieved {len(formatted_analyses)} analyses")
         return formatted_analyses
@@ -144,28 +273,51 @@ def get_all_analyses():
         logger.error(f"Error getting all analyses: {str(e)}")
         return []
 
-def convert_decimals(obj):
-    """Convert Decimal types to regular numbers for JSON serialization"""
+def batch_get_candidates(candidate_ids):
+    """Fetch candidate records in bulk with BatchGetItem (100 keys per call)"""
+    candidates_by_id = {}
+    for i in range(0, len(candidate_ids), 100):
+        request_keys = [{'candidateId': {'S': cid}} for cid in candidate_ids[i:i + 100]]
+        while request_keys:
+            response = _ddb_client.batch_get_item(
+                RequestItems={
+                    CANDIDATES_TABLE: {
+                        'Keys': request_keys,
+                        # Only the fields the analysis formatter reads
+                        'ProjectionExpression': 'candidateId,#n,email,fileName,uploadedAt',
+                        'ExpressionAttributeNames': {'#n': 'name'}
+                    }
+                }
+            )
+            for raw in response.get('Responses', {}).get(CANDIDATES_TABLE, []):
+                item = {k: _deserializer.deserialize(v) for k, v in raw.items()}
+                candidates_by_id[item['candidateId']] = item
+            # Retry any keys DynamoDB throttled out of the batch
+            request_keys = response.get('UnprocessedKeys', {}).get(CANDIDATES_TABLE, {}).get('Keys', [])
+    return candidates_by_id
+
+class DecimalEncoder(json.JSONEncoder):
+    """JSON encoder that renders DynamoDB Decimal values as plain numbers"""
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        return super().default(obj)
+
+def _decimal_default(obj):
     if isinstance(obj, Decimal):
         return float(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_decimals(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_decimals(item) for item in obj]
-    else:
-        return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(body):
+    """Serialize a response body, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(body, default=_decimal_default).decode()
+    return json.dumps(body, cls=DecimalEncoder, separators=(',', ':'))
 
 def create_cors_response(status_code, body):
     """Create CORS-enabled response"""
-    # Convert Decimal types before JSON serialization
-    body = convert_decimals(body)
     return {
         'statusCode': status_code,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps(body)
+        'headers': CORS_HEADERS,
+        'body': dumps_json(body)
     }
\ No newline at end of file
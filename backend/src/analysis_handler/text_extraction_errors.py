@@ -6,15 +6,44 @@ across different document types and processing methods.
 """
 
 import logging
+import re
+import sys
+import time
+import types
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
+
+# pyahocorasick gives single-pass keyword search; optional in the package
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Configure logging for text extraction errors
 logger = logging.getLogger(__name__)
 
-class TextExtractionErrorType(Enum):
-    """Enumeration of text extraction error types"""
+# Timestamps are needed on every error and status update; strftime the
+# second-resolution prefix once per second and append microseconds from the
+# same clock read, skipping a datetime object build per call
+_NOW_CACHE = [0, '']
+
+def _iso_utc_now() -> str:
+    """UTC timestamp in the same shape as datetime.utcnow().isoformat()"""
+    now = time.time()
+    sec = int(now)
+    if sec != _NOW_CACHE[0]:
+        _NOW_CACHE[0] = sec
+        _NOW_CACHE[1] = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))
+    return f"{_NOW_CACHE[1]}.{int((now - sec) * 1e6):06d}"
+
+class TextExtractionErrorType(str, Enum):
+    """Enumeration of text extraction error types
+
+    str subclass so members serialize and format as their wire value
+    directly, with no .value hop at the call sites.
+    """
+    __str__ = str.__str__
     TEXTRACT_JOB_FAILED = "textract_job_failed"
     TEXTRACT_TIMEOUT = "textract_timeout"
     TEXTRACT_INVALID_JOB = "textract_invalid_job"
@@ -29,104 +58,229 @@ class TextExtractionErrorType(Enum):
     EMPTY_DOCUMENT = "empty_document"
     UNKNOWN_ERROR = "unknown_error"
 
+# Intern the wire values so the strings DynamoDB items and log payloads
+# repeat endlessly are shared singletons with cached hashes
+for _member in TextExtractionErrorType:
+    _member._value_ = sys.intern(_member._value_)
+del _member
+
+@dataclass(frozen=True, slots=True)
 class TextExtractionError:
-    """Represents a text extraction error with detailed information"""
-    
-    def __init__(self, 
-                 error_type: TextExtractionErrorType,
-                 message: str,
-                 technical_details: str = None,
-                 retry_possible: bool = True,
-                 suggested_action: str = None):
-        self.error_type = error_type
-        self.message = message
-        self.technical_details = technical_details
-        self.retry_possible = retry_possible
-        self.suggested_action = suggested_action
-        self.timestamp = datetime.utcnow().isoformat()
+    """Represents a text extraction error with detailed information
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for storage/API response"""
-        return {
-            'errorType': self.error_type.value,
+    Frozen dataclass: errors are immutable once built, which is what lets
+    the serialized and log forms be cached alongside the fields.
+    """
+
+    error_type: TextExtractionErrorType
+    message: str
+    technical_details: Optional[str] = None
+    retry_possible: bool = True
+    suggested_action: Optional[str] = None
+    timestamp: str = field(default_factory=_iso_utc_now)
+    _dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    _log_payload: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen=True blocks normal assignment, so the cached forms go in
+        # through object.__setattr__
+        object.__setattr__(self, '_dict', {
+            'errorType': self.error_type,
             'message': self.message,
             'technicalDetails': self.technical_details,
             'retryPossible': self.retry_possible,
             'suggestedAction': self.suggested_action,
             'timestamp': self.timestamp
-        }
+        })
+        # 'message' is reserved by logging.makeRecord for extra= dicts,
+        # so the user message travels as 'error_message'
+        object.__setattr__(self, '_log_payload', {
+            'event': 'text_extraction_error',
+            'error_type': self.error_type,
+            'error_message': self.message,
+            'technical_details': self.technical_details,
+            'retry_possible': self.retry_possible,
+            'timestamp': self.timestamp
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert error to dictionary for storage/API response"""
+        # Copy so callers that merge fields in (status updates) cannot
+        # corrupt the cached payload
+        return self._dict.copy()
+
+# Every trigger word classify_error looks for, compiled into one automaton at
+# import when pyahocorasick is bundled
+_CLASSIFIER_KEYWORDS = (
+    'textract', 'invalid', 'expired', 'timeout', 'timed out', 'failed',
+    'corrupt', 'damaged', 'invalid format', 'password', 'encrypted',
+    'protected', 'too large', 'size limit', 'file size', 'unsupported',
+    'format not supported', 'empty', 'no text', 'network', 'connection',
+    'permission', 'access denied', 'forbidden'
+)
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _CLASSIFIER_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+# Regex fallback: one C-level scan over the message still beats a dozen
+# Python substring passes. The alternation sits inside a lookahead so a
+# match consumes no text and triggers starting at different offsets can
+# overlap (the automaton reports both 'no text' and 'textract' in
+# "no textract job"; a plain alternation would eat the first and skip the
+# second). Longest-first ordering so multi-word triggers win over their
+# prefixes at the same offset.
+_KEYWORD_RE = re.compile('(?=(' + '|'.join(
+    re.escape(keyword)
+    for keyword in sorted(_CLASSIFIER_KEYWORDS, key=len, reverse=True)
+) + '))')
+
+# Trigger-word groups per error type, checked against the automaton's hit set
+_CORRUPT_HITS = frozenset(('corrupt', 'damaged', 'invalid format'))
+_ENCRYPTED_HITS = frozenset(('password', 'encrypted', 'protected'))
+_TOO_LARGE_HITS = frozenset(('too large', 'size limit', 'file size'))
+_UNSUPPORTED_HITS = frozenset(('unsupported', 'format not supported'))
+_EMPTY_HITS = frozenset(('empty', 'no text'))
+_NETWORK_HITS = frozenset(('network', 'connection', 'timeout'))
+_PERMISSION_HITS = frozenset(('permission', 'access denied', 'forbidden'))
+
+def _classify_from_hits(hits) -> TextExtractionErrorType:
+    """Map the set of trigger words found in a message to an error type
+
+    Mirrors the branch ordering of the substring-based classification so both
+    paths agree on every message.
+    """
+    if not hits:
+        return TextExtractionErrorType.UNKNOWN_ERROR
+    
+    if 'textract' in hits:
+        if 'invalid' in hits or 'expired' in hits:
+            return TextExtractionErrorType.TEXTRACT_INVALID_JOB
+        if 'timeout' in hits or 'timed out' in hits:
+            return TextExtractionErrorType.TEXTRACT_TIMEOUT
+        if 'failed' in hits:
+            return TextExtractionErrorType.TEXTRACT_JOB_FAILED
+        return TextExtractionErrorType.TEXTRACT_SERVICE_ERROR
+    
+    if not hits.isdisjoint(_CORRUPT_HITS):
+        return TextExtractionErrorType.DOCUMENT_CORRUPTED
+    if not hits.isdisjoint(_ENCRYPTED_HITS):
+        return TextExtractionErrorType.DOCUMENT_ENCRYPTED
+    if not hits.isdisjoint(_TOO_LARGE_HITS):
+        return TextExtractionErrorType.DOCUMENT_TOO_LARGE
+    if not hits.isdisjoint(_UNSUPPORTED_HITS):
+        return TextExtractionErrorType.UNSUPPORTED_FORMAT
+    if not hits.isdisjoint(_EMPTY_HITS):
+        return TextExtractionErrorType.EMPTY_DOCUMENT
+    if not hits.isdisjoint(_NETWORK_HITS):
+        if 'timeout' in hits:
+            return TextExtractionErrorType.PROCESSING_TIMEOUT
+        return TextExtractionErrorType.NETWORK_ERROR
+    if not hits.isdisjoint(_PERMISSION_HITS):
+        return TextExtractionErrorType.PERMISSION_DENIED
+    
+    return TextExtractionErrorType.UNKNOWN_ERROR
+
+# Fallback options shared by every error type without a specific entry
+_DEFAULT_FALLBACK = {
+    'show_manual_input': True,
+    'allow_retry': True,
+    'suggest_contact_support': True
+}
 
 class TextExtractionErrorHandler:
     """Handles text extraction errors and provides user-friendly messages"""
     
-    # Error message templates for different error types
-    ERROR_MESSAGES = {
-        TextExtractionErrorType.TEXTRACT_JOB_FAILED: {
-            'user_message': 'Text extraction failed due to document processing issues.',
-            'suggested_action': 'Try uploading a different version of the document or convert it to a different format.',
-            'retry_possible': True
-        },
-        TextExtractionErrorType.TEXTRACT_TIMEOUT: {
-            'user_message': 'Text extraction timed out. The document may be too large or complex.',
-            'suggested_action': 'Try uploading a smaller document or split large documents into smaller sections.',
-            'retry_possible': True
-        },
-        TextExtractionErrorType.TEXTRACT_INVALID_JOB: {
-            'user_message': 'Text extraction job expired or was invalid.',
-            'suggested_action': 'Please upload the document again to restart the extraction process.',
-            'retry_possible': True
-        },
-        TextExtractionErrorType.TEXTRACT_SERVICE_ERROR: {
-            'user_message': 'AWS Textract service is temporarily unavailable.',
-            'suggested_action': 'This is usually temporary. Please try again in a few minutes.',
-            'retry_possible': True
-        },
-        TextExtractionErrorType.DOCUMENT_CORRUPTED: {
-            'user_message': 'The document appears to be corrupted or damaged.',
-            'suggested_action': 'Try opening the document in its native application and re-saving it, then upload again.',
-            'retry_possible': False
-        },
-        TextExtractionErrorType.DOCUMENT_ENCRYPTED: {
-            'user_message': 'The document is password-protected or encrypted.',
-            'suggested_action': 'Remove password protection from the document and upload again.',
-            'retry_possible': False
-        },
-        TextExtractionErrorType.DOCUMENT_TOO_LARGE: {
-            'user_message': 'The document is too large for processing.',
-            'suggested_action': 'Please use a document smaller than 10MB or compress the file.',
-            'retry_possible': False
-        },
-        TextExtractionErrorType.UNSUPPORTED_FORMAT: {
-            'user_message': 'The document format is not supported.',
-            'suggested_action': 'Please use PDF, DOCX, or TXT format.',
-            'retry_possible': False
-        },
-        TextExtractionErrorType.NETWORK_ERROR: {
-            'user_message': 'Network connection error occurred during processing.',
-            'suggested_action': 'Check your internet connection and try again.',
-            'retry_possible': True
-        },
-        TextExtractionErrorType.PERMISSION_DENIED: {
-            'user_message': 'Access denied while processing the document.',
-            'suggested_action': 'Ensure the document is not restricted and try again.',
-            'retry_possible': True
-        },
-        TextExtractionErrorType.PROCESSING_TIMEOUT: {
-            'user_message': 'Document processing timed out.',
-            'suggested_action': 'Try uploading a smaller or simpler document.',
-            'retry_possible': True
-        },
-        TextExtractionErrorType.EMPTY_DOCUMENT: {
-            'user_message': 'No text content was found in the document.',
-            'suggested_action': 'Ensure the document contains selectable text, not just images or scanned content.',
-            'retry_possible': False
-        },
-        TextExtractionErrorType.UNKNOWN_ERROR: {
-            'user_message': 'An unexpected error occurred during text extraction.',
-            'suggested_action': 'Please try again or contact support if the problem persists.',
-            'retry_possible': True
-        }
-    }
+    # Error message templates per error type. Each entry is a
+    # (user_message, suggested_action, retry_possible, fallback_options)
+    # tuple: one lookup retrieves everything the API response needs. The
+    # read-only view keeps every caller safely on the one shared table; the
+    # inner fallback dicts stay plain dicts because they are embedded in API
+    # responses and MappingProxyType does not JSON-serialize.
+    ERROR_MESSAGES = types.MappingProxyType({
+        TextExtractionErrorType.TEXTRACT_JOB_FAILED: (
+            'Text extraction failed due to document processing issues.',
+            'Try uploading a different version of the document or convert it to a different format.',
+            True,
+            {'show_manual_input': True, 'allow_retry': True, 'suggest_format_conversion': True}
+        ),
+        TextExtractionErrorType.TEXTRACT_TIMEOUT: (
+            'Text extraction timed out. The document may be too large or complex.',
+            'Try uploading a smaller document or split large documents into smaller sections.',
+            True,
+            {'show_manual_input': True, 'allow_retry': True, 'suggest_file_splitting': True}
+        ),
+        TextExtractionErrorType.TEXTRACT_INVALID_JOB: (
+            'Text extraction job expired or was invalid.',
+            'Please upload the document again to restart the extraction process.',
+            True,
+            _DEFAULT_FALLBACK
+        ),
+        TextExtractionErrorType.TEXTRACT_SERVICE_ERROR: (
+            'AWS Textract service is temporarily unavailable.',
+            'This is usually temporary. Please try again in a few minutes.',
+            True,
+            _DEFAULT_FALLBACK
+        ),
+        TextExtractionErrorType.DOCUMENT_CORRUPTED: (
+            'The document appears to be corrupted or damaged.',
+            'Try opening the document in its native application and re-saving it, then upload again.',
+            False,
+            {'show_manual_input': True, 'allow_retry': False, 'suggest_file_repair': True}
+        ),
+        TextExtractionErrorType.DOCUMENT_ENCRYPTED: (
+            'The document is password-protected or encrypted.',
+            'Remove password protection from the document and upload again.',
+            False,
+            {'show_manual_input': True, 'allow_retry': False, 'suggest_password_removal': True}
+        ),
+        TextExtractionErrorType.DOCUMENT_TOO_LARGE: (
+            'The document is too large for processing.',
+            'Please use a document smaller than 10MB or compress the file.',
+            False,
+            {'show_manual_input': True, 'allow_retry': False, 'suggest_file_compression': True}
+        ),
+        TextExtractionErrorType.UNSUPPORTED_FORMAT: (
+            'The document format is not supported.',
+            'Please use PDF, DOCX, or TXT format.',
+            False,
+            _DEFAULT_FALLBACK
+        ),
+        TextExtractionErrorType.NETWORK_ERROR: (
+            'Network connection error occurred during processing.',
+            'Check your internet connection and try again.',
+            True,
+            _DEFAULT_FALLBACK
+        ),
+        TextExtractionErrorType.PERMISSION_DENIED: (
+            'Access denied while processing the document.',
+            'Ensure the document is not restricted and try again.',
+            True,
+            _DEFAULT_FALLBACK
+        ),
+        TextExtractionErrorType.PROCESSING_TIMEOUT: (
+            'Document processing timed out.',
+            'Try uploading a smaller or simpler document.',
+            True,
+            _DEFAULT_FALLBACK
+        ),
+        TextExtractionErrorType.EMPTY_DOCUMENT: (
+            'No text content was found in the document.',
+            'Ensure the document contains selectable text, not just images or scanned content.',
+            False,
+            {'show_manual_input': True, 'allow_retry': False, 'suggest_content_check': True}
+        ),
+        TextExtractionErrorType.UNKNOWN_ERROR: (
+            'An unexpected error occurred during text extraction.',
+            'Please try again or contact support if the problem persists.',
+            True,
+            _DEFAULT_FALLBACK
+        )
+    })
 
     @classmethod
     def classify_error(cls, error_message: str, error_context: Dict[str, Any] = None) -> TextExtractionErrorType:
@@ -140,49 +294,44 @@ class TextExtractionErrorHandler:
         Returns:
             TextExtractionErrorType: The classified error type
         """
+        # Fast-reject before any string work; covers None and '' alike
         if not error_message:
             return TextExtractionErrorType.UNKNOWN_ERROR
-            
-        error_lower = error_message.lower()
-        
-        # Textract-specific errors
-        if 'textract' in error_lower:
-            if 'invalid' in error_lower or 'expired' in error_lower:
-                return TextExtractionErrorType.TEXTRACT_INVALID_JOB
-            elif 'timeout' in error_lower or 'timed out' in error_lower:
-                return TextExtractionErrorType.TEXTRACT_TIMEOUT
-            elif 'failed' in error_lower:
-                return TextExtractionErrorType.TEXTRACT_JOB_FAILED
-            else:
-                return TextExtractionErrorType.TEXTRACT_SERVICE_ERROR
-        
-        # Document-related errors
-        if any(keyword in error_lower for keyword in ['corrupt', 'damaged', 'invalid format']):
-            return TextExtractionErrorType.DOCUMENT_CORRUPTED
-        
-        if any(keyword in error_lower for keyword in ['password', 'encrypted', 'protected']):
-            return TextExtractionErrorType.DOCUMENT_ENCRYPTED
-        
-        if any(keyword in error_lower for keyword in ['too large', 'size limit', 'file size']):
-            return TextExtractionErrorType.DOCUMENT_TOO_LARGE
-        
-        if any(keyword in error_lower for keyword in ['unsupported', 'format not supported']):
-            return TextExtractionErrorType.UNSUPPORTED_FORMAT
-        
-        if 'empty' in error_lower or 'no text' in error_lower:
-            return TextExtractionErrorType.EMPTY_DOCUMENT
-        
-        # Network and service errors
-        if any(keyword in error_lower for keyword in ['network', 'connection', 'timeout']):
-            if 'timeout' in error_lower:
-                return TextExtractionErrorType.PROCESSING_TIMEOUT
-            else:
-                return TextExtractionErrorType.NETWORK_ERROR
+
+        # casefold is the one normalization pass; every keyword below is
+        # already lowercase ASCII so no further per-check folding is needed
+        error_lower = error_message.casefold()
         
-        if any(keyword in error_lower for keyword in ['permission', 'access denied', 'forbidden']):
-            return TextExtractionErrorType.PERMISSION_DENIED
+        # With the automaton every trigger word is found in one scan of the
+        # message; membership checks on the hit set replace substring searches
+        if _KEYWORD_AUTOMATON is not None:
+            return _classify_from_hits(
+                {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(error_lower)}
+            )
         
-        return TextExtractionErrorType.UNKNOWN_ERROR
+        # Regex fallback: same single-scan shape without the C extension
+        hits = set(_KEYWORD_RE.findall(error_lower))
+        if 'invalid format' in hits:
+            # The lookahead reports only the longest trigger at each offset;
+            # the automaton would have reported the prefix word too
+            hits.add('invalid')
+        return _classify_from_hits(hits)
+
+    @classmethod
+    def _classify_and_lookup(cls, error_message: str,
+                             error_context: Dict[str, Any] = None
+                             ) -> Tuple[TextExtractionErrorType, str, str, bool]:
+        """Classify a message and fetch its table entry in one pass
+
+        Returns (error_type, user_message, suggested_action, retry_possible);
+        both create_error and handle_textract_error build from this.
+        """
+        error_type = cls.classify_error(error_message, error_context)
+        # classify_error can only return members of TextExtractionErrorType
+        # and ERROR_MESSAGES covers every member, so index directly instead
+        # of paying for a .get whose fallback entry was fetched eagerly
+        user_message, suggested_action, retry_possible, _ = cls.ERROR_MESSAGES[error_type]
+        return error_type, user_message, suggested_action, retry_possible
 
     @classmethod
     def create_error(cls, error_message: str, error_context: Dict[str, Any] = None) -> TextExtractionError:
@@ -196,15 +345,15 @@ class TextExtractionErrorHandler:
         Returns:
             TextExtractionError: A structured error object
         """
-        error_type = cls.classify_error(error_message, error_context)
-        error_info = cls.ERROR_MESSAGES.get(error_type, cls.ERROR_MESSAGES[TextExtractionErrorType.UNKNOWN_ERROR])
+        error_type, user_message, suggested_action, retry_possible = \
+            cls._classify_and_lookup(error_message, error_context)
         
         return TextExtractionError(
             error_type=error_type,
-            message=error_info['user_message'],
+            message=user_message,
             technical_details=error_message,
-            retry_possible=error_info['retry_possible'],
-            suggested_action=error_info['suggested_action']
+            retry_possible=retry_possible,
+            suggested_action=suggested_action
         )
 
     @classmethod
@@ -223,15 +372,15 @@ class TextExtractionErrorHandler:
         
         if job_status == 'FAILED':
             error_message = f"Textract job failed: {status_message}"
-            error_type = cls.classify_error(error_message)
-            error_info = cls.ERROR_MESSAGES.get(error_type, cls.ERROR_MESSAGES[TextExtractionErrorType.TEXTRACT_JOB_FAILED])
+            error_type, user_message, suggested_action, retry_possible = \
+                cls._classify_and_lookup(error_message)
             
             return TextExtractionError(
                 error_type=error_type,
-                message=error_info['user_message'],
+                message=user_message,
                 technical_details=error_message,
-                retry_possible=error_info['retry_possible'],
-                suggested_action=error_info['suggested_action']
+                retry_possible=retry_possible,
+                suggested_action=suggested_action
             )
         
         return cls.create_error(f"Unexpected Textract status: {job_status}")
@@ -246,22 +395,21 @@ class TextExtractionErrorHandler:
             candidate_id: Optional candidate ID for context
             additional_context: Additional context to include in log
         """
-        log_data = {
-            'event': 'text_extraction_error',
-            'error_type': error.error_type.value,
-            'message': error.message,
-            'technical_details': error.technical_details,
-            'retry_possible': error.retry_possible,
-            'timestamp': error.timestamp
-        }
-        
-        if candidate_id:
-            log_data['candidate_id'] = candidate_id
-            
-        if additional_context:
-            log_data.update(additional_context)
-        
-        logger.error(f"Text extraction error: {error.error_type.value}", extra=log_data)
+        # Skip all payload work when ERROR records are filtered out
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+
+        # The base payload is cached on the error; copy only when per-call
+        # context has to be merged in
+        log_data = error._log_payload
+        if candidate_id or additional_context:
+            log_data = dict(log_data)
+            if candidate_id:
+                log_data['candidate_id'] = candidate_id
+            if additional_context:
+                log_data.update(additional_context)
+
+        logger.error(f"Text extraction error: {error.error_type}", extra=log_data)
 
 def get_fallback_behavior(error_type: TextExtractionErrorType) -> Dict[str, Any]:
     """
@@ -273,44 +421,9 @@ def get_fallback_behavior(error_type: TextExtractionErrorType) -> Dict[str, Any]
     Returns:
         Dict containing fallback behavior configuration
     """
-    fallback_behaviors = {
-        TextExtractionErrorType.TEXTRACT_JOB_FAILED: {
-            'show_manual_input': True,
-            'allow_retry': True,
-            'suggest_format_conversion': True
-        },
-        TextExtractionErrorType.TEXTRACT_TIMEOUT: {
-            'show_manual_input': True,
-            'allow_retry': True,
-            'suggest_file_splitting': True
-        },
-        TextExtractionErrorType.DOCUMENT_CORRUPTED: {
-            'show_manual_input': True,
-            'allow_retry': False,
-            'suggest_file_repair': True
-        },
-        TextExtractionErrorType.DOCUMENT_ENCRYPTED: {
-            'show_manual_input': True,
-            'allow_retry': False,
-            'suggest_password_removal': True
-        },
-        TextExtractionErrorType.DOCUMENT_TOO_LARGE: {
-            'show_manual_input': True,
-            'allow_retry': False,
-            'suggest_file_compression': True
-        },
-        TextExtractionErrorType.EMPTY_DOCUMENT: {
-            'show_manual_input': True,
-            'allow_retry': False,
-            'suggest_content_check': True
-        }
-    }
-    
-    return fallback_behaviors.get(error_type, {
-        'show_manual_input': True,
-        'allow_retry': True,
-        'suggest_contact_support': True
-    })
+    # The behaviors live in ERROR_MESSAGES; this shim stays for callers that
+    # only want the fallback portion, without rebuilding any dicts per call
+    return TextExtractionErrorHandler.ERROR_MESSAGES[error_type][3]
 
 def format_error_for_api(error: TextExtractionError) -> Dict[str, Any]:
     """
@@ -322,19 +435,19 @@ def format_error_for_api(error: TextExtractionError) -> Dict[str, Any]:
     Returns:
         Dict formatted for API response
     """
-    fallback = get_fallback_behavior(error.error_type)
-    
+    # One expression, one table index; technical_details is already None or
+    # a string, so it passes through as-is
     return {
         'success': False,
         'error': {
-            'type': error.error_type.value,
+            'type': error.error_type,
             'message': error.message,
             'suggestedAction': error.suggested_action,
             'retryPossible': error.retry_possible,
-            'fallbackOptions': fallback,
+            'fallbackOptions': TextExtractionErrorHandler.ERROR_MESSAGES[error.error_type][3],
             'timestamp': error.timestamp
         },
-        'technicalDetails': error.technical_details if error.technical_details else None
+        'technicalDetails': error.technical_details
     }
 
 def create_extraction_status_update(candidate_id: str, status: str, error: TextExtractionError = None) -> Dict[str, Any]:
@@ -352,7 +465,7 @@ def create_extraction_status_update(candidate_id: str, status: str, error: TextE
     update_data = {
         'candidateId': candidate_id,
         'textExtractionStatus': status,
-        'updatedAt': datetime.utcnow().isoformat()
+        'updatedAt': _iso_utc_now()
     }
     
     if error:
@@ -1,31 +1,63 @@
 import json
+import concurrent.futures
 import boto3
 from datetime import datetime
 import os
 from botocore.exceptions import ClientError
+from boto3.dynamodb.types import TypeDeserializer
 import logging
 from decimal import Decimal
 
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # Initialize AWS clients
-region = boto3.Session().region_name or 'ap-south-1'
+# Lambda sets AWS_REGION; reading it avoids a config-chain walk at cold start
+region = os.environ.get('AWS_REGION', 'ap-south-1')
 dynamodb = boto3.resource('dynamodb', region_name=region)
 
+# Low-level client + deserializer for the bulk read paths
+_ddb_client = dynamodb.meta.client
+_deserializer = TypeDeserializer()
+
 # Environment variables
 CANDIDATES_TABLE = os.environ['CANDIDATES_TABLE']
+
+# type-updatedAt-index is safe to serve list reads only after every
+# pre-migration row has been stamped with _type; operators flip this once
+# the backfill has run
+_TYPE_INDEX_BACKFILLED = os.environ.get('TYPE_INDEX_BACKFILLED', '').lower() in ('1', 'true', 'yes')
 ANALYSES_TABLE = os.environ['ANALYSES_TABLE']
 
+# Table handles are created once per container so warm invocations reuse them
+CANDIDATES_TBL = dynamodb.Table(CANDIDATES_TABLE)
+ANALYSES_TBL = dynamodb.Table(ANALYSES_TABLE)
+
+# CORS headers are identical for every response; build them once
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Content-Type': 'application/json'
+}
+OPTIONS_RESPONSE = {'statusCode': 200, 'headers': CORS_HEADERS, 'body': '{}'}
+
 def lambda_handler(event, context):
     """Retrieve candidate information with real-time data"""
     try:
         # Handle CORS preflight request
         if event.get('httpMethod') == 'OPTIONS':
-            return create_cors_response(200, {})
+            return OPTIONS_RESPONSE
         
-        logger.info(f"Candidates handler invoked with event: {json.dumps(event)}")
+        # Full event only at DEBUG; %s defers serialization until a sink wants it
+        logger.debug("Candidates handler invoked with event: %s", event)
         
         # Get all candidates with their analysis status
         candidates_data = get_all_candidates_with_status()
@@ -36,34 +68,119 @@ def lambda_handler(event, context):
         logger.error(f"Error in candidates handler: {str(e)}")
         return create_cors_response(500, {'error': str(e)})
 
+def scan_all_items(table, **scan_kwargs):
+    """Scan a table page by page, yielding items beyond DynamoDB's 1 MB page limit
+
+    Bulk scans go through the low-level client with one explicit
+    TypeDeserializer pass per item, skipping the per-call overhead of the
+    resource-layer wrappers.
+    """
+    scan_kwargs['TableName'] = table.name
+    while True:
+        response = _ddb_client.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            yield {k: _deserializer.deserialize(v) for k, v in item.items()}
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+# Parallel scans only pay off once a table is past a few thousand items
+_PARALLEL_SCAN_MIN_ITEMS = 5000
+_PARALLEL_SCAN_SEGMENTS = 4
+
+def _scan_segment(table, segment, scan_kwargs):
+    return list(scan_all_items(
+        table, Segment=segment, TotalSegments=_PARALLEL_SCAN_SEGMENTS, **scan_kwargs
+    ))
+
+def scan_table_fast(table, **scan_kwargs):
+    """Scan a whole table, splitting into parallel segments when it is large
+
+    item_count comes from DescribeTable (cached on the Table object) and is
+    approximate, which is fine for a threshold check.
+    """
+    if (table.item_count or 0) < _PARALLEL_SCAN_MIN_ITEMS:
+        return list(scan_all_items(table, **scan_kwargs))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_PARALLEL_SCAN_SEGMENTS) as executor:
+        futures = [
+            executor.submit(_scan_segment, table, segment, dict(scan_kwargs))
+            for segment in range(_PARALLEL_SCAN_SEGMENTS)
+        ]
+        items = []
+        for future in futures:
+            items.extend(future.result())
+    return items
+
+# Only the fields the candidates list formatter reads
+_CANDIDATE_SUMMARY_PROJECTION = ('candidateId,#n,email,fileName,fileType,uploadedAt,#s,'
+                                 'textExtractionStatus,textractJobId,s3Key,createdAt,updatedAt')
+
+def query_all_items(table, **query_kwargs):
+    """Query page by page, yielding items across pagination boundaries"""
+    while True:
+        response = table.query(**query_kwargs)
+        yield from response.get('Items', [])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        query_kwargs['ExclusiveStartKey'] = last_key
+
+def fetch_candidates_newest_first():
+    """Read candidates newest-first from type-updatedAt-index, scanning as fallback
+
+    Returns (items, presorted); presorted is False when the scan path ran and
+    the caller still has to sort. The index only holds rows stamped with
+    _type, so it is trusted only once the backfill flag says every
+    pre-migration row has been stamped — a non-empty but partial index would
+    silently drop the older candidates.
+    """
+    if _TYPE_INDEX_BACKFILLED:
+        try:
+            items = list(query_all_items(
+                CANDIDATES_TBL,
+                IndexName='type-updatedAt-index',
+                KeyConditionExpression='#t = :t',
+                ProjectionExpression=_CANDIDATE_SUMMARY_PROJECTION,
+                ExpressionAttributeNames={'#t': '_type', '#s': 'status', '#n': 'name'},
+                ExpressionAttributeValues={':t': 'candidate'},
+                ScanIndexForward=False
+            ))
+            if items:
+                return items, True
+        except ClientError as e:
+            logger.warning(f"type-updatedAt-index unavailable, falling back to scan: {str(e)}")
+    return scan_table_fast(
+        CANDIDATES_TBL,
+        ProjectionExpression=_CANDIDATE_SUMMARY_PROJECTION,
+        ExpressionAttributeNames={'#s': 'status', '#n': 'name'}
+    ), False
+
 def get_all_candidates_with_status():
     """Get all candidates with their processing status"""
     try:
-        candidates_table = dynamodb.Table(CANDIDATES_TABLE)
-        
-        # Scan all candidates
-        response = candidates_table.scan()
-        candidates = response.get('Items', [])
-        
-        # Get analysis status for each candidate
-        analyses_table = dynamodb.Table(ANALYSES_TABLE)
+        # Range-read newest-first off the GSI; avoids full scan + Python sort
+        candidates, presorted = fetch_candidates_newest_first()
         
+        # Pull analysis status for all candidates in one scan instead of a query per candidate
+        analyses_by_candidate = {
+            a['candidateId']: a
+            for a in scan_all_items(
+                ANALYSES_TBL,
+                ProjectionExpression='candidateId,#s,overallScore,skills',
+                ExpressionAttributeNames={'#s': 'status'}
+            )
+            if a.get('candidateId')
+        }
+
         formatted_candidates = []
         for candidate in candidates:
             candidate_id = candidate.get('candidateId')
-            
-            # Check if analysis exists
-            analysis_response = analyses_table.query(
-                IndexName='candidateId-index',
-                KeyConditionExpression='candidateId = :candidate_id',
-                ExpressionAttributeValues={':candidate_id': candidate_id}
-            )
-            
-            analysis_data = analysis_response['Items'][0] if analysis_response['Items'] else None
-            
+            analysis_data = analyses_by_candidate.get(candidate_id)
+
             # Format candidate data with real-time status
             formatted_candidate = {
-                    'candidateId': candidate_id,
+                'candidateId': candidate_id,
                 'name': candidate.get('name', 'Unknown'),
                 'email': candidate.get('email', 'Unknown'),
                 'fileName': candidate.get('fileName', 'Unknown'),
@@ -81,35 +198,39 @@ def get_all_candidates_with_status():
             }
             formatted_candidates.append(formatted_candidate)
         
-        # Sort by upload date (newest first)
-        formatted_candidates.sort(key=lambda x: x.get('uploadedAt') or x.get('createdAt') or '', reverse=True)
+        if not presorted:
+            # Scan fallback returns unordered items; sort newest first
+            formatted_candidates.sort(key=lambda x: x.get('uploadedAt') or x.get('createdAt') or '', reverse=True)
         
         logger.info(f"Retrieved {len(formatted_candidates)} candidates")
         return formatted_candidates
-                
-            except Exception as e:
+
+    except Exception as e:
         logger.error(f"Error getting candidates with status: {str(e)}")
         return []
 
-def convert_decimals(obj):
-    """Convert Decimal objects to float for JSON serialization"""
+class DecimalEncoder(json.JSONEncoder):
+    """JSON encoder that renders DynamoDB Decimal values as plain numbers"""
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        return super().default(obj)
+
+def _decimal_default(obj):
     if isinstance(obj, Decimal):
         return float(obj)
-    elif isinstance(obj, dict):
-        return {key: convert_decimals(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_decimals(item) for item in obj]
-    return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(body):
+    """Serialize a response body, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(body, default=_decimal_default).decode()
+    return json.dumps(body, cls=DecimalEncoder, separators=(',', ':'))
 
 def create_cors_response(status_code, body):
     """Create CORS-enabled response"""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps(convert_decimals(body))
+        'headers': CORS_HEADERS,
+        'body': dumps_json(body)
     }
\ No newline at end of file
@@ -8,14 +8,51 @@ for all Lambda functions in the Resumify application.
 import json
 import logging
 import os
+import re
+import sys
 import time
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
 from functools import wraps
-import boto3
 from botocore.exceptions import ClientError
 
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# One shared CloudWatch client for every CloudWatchLogger instance; pool sized
+# for concurrent threads, built on first use
+_cloudwatch_client = None
+
+def _get_cloudwatch_client():
+    global _cloudwatch_client
+    if _cloudwatch_client is None:
+        # Imported here so handlers that never emit a metric (or run with
+        # USE_EMF) skip loading boto3's service model at cold start
+        import boto3
+        from botocore.config import Config
+        _cloudwatch_client = boto3.client(
+            'cloudwatch',
+            config=Config(max_pool_connections=50, retries={'max_attempts': 2})
+        )
+    return _cloudwatch_client
+
+# Emit metrics as Embedded Metric Format stdout lines instead of PutMetricData
+# API calls; CloudWatch Logs extracts them server-side at no request latency
+_USE_EMF = os.environ.get('USE_EMF') == '1'
+
+# Cheap candidate-id probe for request bodies; spares a full JSON parse of
+# large (base64 resume) payloads when only this one string is needed
+_CID = re.compile(rb'"candidateId"\s*:\s*"([^"]+)"')
+
 class LogLevel(Enum):
     """Standard log levels"""
     DEBUG = "DEBUG"
@@ -48,6 +85,34 @@ class EventType(Enum):
     EXTERNAL_API_CALL = "external_api_call"
     PERFORMANCE_METRIC = "performance_metric"
 
+# LogLevel -> stdlib logging level, used for cheap enabled-checks
+_LEVEL_MAP = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+}
+
+# Pre-built "[event_type] " prefixes; one concat per log call instead of an
+# f-string format
+_EVENT_PREFIX = {e: f'[{e.value}] ' for e in EventType}
+
+# Error-flavored events, checked by membership instead of substring search
+_ERROR_EVENTS = frozenset({
+    EventType.FUNCTION_ERROR,
+    EventType.UPLOAD_ERROR,
+    EventType.TEXTRACT_JOB_ERROR,
+    EventType.TEXT_EXTRACTION_ERROR,
+    EventType.ANALYSIS_ERROR,
+    EventType.MATCHING_ERROR,
+})
+
+# One formatter shared by every logger instance; it is stateless
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 class CloudWatchLogger:
     """Centralized CloudWatch logger with structured logging and metrics"""
     
@@ -56,32 +121,42 @@ class CloudWatchLogger:
         self.logger = logging.getLogger(self.function_name)
         self.logger.setLevel(logging.INFO)
         
-        # Create structured formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Ensure we have a handler
-        if not self.logger.handlers:
+        # hasHandlers walks up to the root logger, so the handler the Lambda
+        # runtime pre-installs there counts and we do not double-emit
+        if not self.logger.hasHandlers():
             console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
+            console_handler.setFormatter(_FORMATTER)
             self.logger.addHandler(console_handler)
         
-        # CloudWatch client for custom metrics
-        self.cloudwatch = boto3.client('cloudwatch')
-        
+        # Direct dispatch table; avoids an if/elif ladder per log call
+        self._log_fn = {
+            LogLevel.DEBUG: self.logger.debug,
+            LogLevel.INFO: self.logger.info,
+            LogLevel.WARNING: self.logger.warning,
+            LogLevel.ERROR: self.logger.error,
+            LogLevel.CRITICAL: self.logger.critical,
+        }
+
         # Performance tracking
         self.start_times = {}
-        self.metrics_buffer = []
+
+        # Metrics are buffered and flushed in batches off the request path
+        self.metrics_buffer = deque(maxlen=10000)
+        self._flush_thread = None
+        self._flush_lock = threading.Lock()
+        atexit.register(self._flush_metrics_now)
     
     def log_structured(self, level: LogLevel, event_type: EventType, message: str, 
                       candidate_id: str = None, **kwargs):
         """Log structured event with consistent format"""
+        # Skip building the structured payload when the record would be dropped
+        if not self.logger.isEnabledFor(_LEVEL_MAP[level]):
+            return
+
+        # No 'timestamp' key: the formatter's %(asctime)s already stamps records
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
             'function_name': self.function_name,
             'event_type': event_type.value,
-            'log_message': message,  # Renamed from 'message' to avoid conflict
             'candidate_id': candidate_id,
             'aws_request_id': kwargs.get('aws_request_id'),
             'correlation_id': kwargs.get('correlation_id'),
@@ -92,22 +167,18 @@ class CloudWatchLogger:
         log_data = {k: v for k, v in log_data.items() if v is not None}
         
         # Log with appropriate level
-        log_message = f"[{event_type.value}] {message}"
-        
-        if level == LogLevel.DEBUG:
-            self.logger.debug(log_message, extra=log_data)
-        elif level == LogLevel.INFO:
-            self.logger.info(log_message, extra=log_data)
-        elif level == LogLevel.WARNING:
-            self.logger.warning(log_message, extra=log_data)
-        elif level == LogLevel.ERROR:
-            self.logger.error(log_message, extra=log_data)
-        elif level == LogLevel.CRITICAL:
-            self.logger.critical(log_message, extra=log_data)
+        self._log_fn[level](_EVENT_PREFIX[event_type] + message, extra=log_data)
     
     def log_function_start(self, event: Dict[str, Any], context, candidate_id: str = None):
         """Log Lambda function start"""
-        self.start_times[context.aws_request_id] = time.time()
+        # Monotonic clock for durations; immune to NTP steps, no float drift
+        self.start_times[context.aws_request_id] = time.perf_counter_ns()
+        
+        # Alias the nested event dicts once instead of re-walking them (and
+        # allocating sentinel dicts) per lookup
+        hdrs = event.get('headers') or {}
+        rc = event.get('requestContext') or {}
+        ident = rc.get('identity') or {}
         
         self.log_structured(
             LogLevel.INFO,
@@ -119,8 +190,8 @@ class CloudWatchLogger:
             memory_limit_mb=context.memory_limit_in_mb,
             http_method=event.get('httpMethod'),
             resource_path=event.get('resource'),
-            user_agent=event.get('headers', {}).get('User-Agent'),
-            source_ip=event.get('requestContext', {}).get('identity', {}).get('sourceIp')
+            user_agent=hdrs.get('User-Agent'),
+            source_ip=ident.get('sourceIp')
         )
     
     def log_function_end(self, context, candidate_id: str = None, success: bool = True, 
@@ -130,7 +201,7 @@ class CloudWatchLogger:
         duration_ms = None
         
         if request_id in self.start_times:
-            duration_ms = (time.time() - self.start_times[request_id]) * 1000
+            duration_ms = (time.perf_counter_ns() - self.start_times[request_id]) / 1e6
             del self.start_times[request_id]
         
         self.log_structured(
@@ -157,7 +228,7 @@ class CloudWatchLogger:
         duration_ms = None
         
         if request_id in self.start_times:
-            duration_ms = (time.time() - self.start_times[request_id]) * 1000
+            duration_ms = (time.perf_counter_ns() - self.start_times[request_id]) / 1e6
             del self.start_times[request_id]
         
         self.log_structured(
@@ -207,7 +278,7 @@ class CloudWatchLogger:
                           page_count: int = None, error: str = None):
         """Log Textract-related events"""
         self.log_structured(
-            LogLevel.INFO if 'ERROR' not in event_type.value else LogLevel.ERROR,
+            LogLevel.ERROR if event_type in _ERROR_EVENTS else LogLevel.INFO,
             event_type,
             f"Textract event: {event_type.value}",
             candidate_id=candidate_id,
@@ -235,7 +306,7 @@ class CloudWatchLogger:
                           overall_score: float = None, error: str = None):
         """Log analysis-related events"""
         self.log_structured(
-            LogLevel.INFO if 'ERROR' not in event_type.value else LogLevel.ERROR,
+            LogLevel.ERROR if event_type in _ERROR_EVENTS else LogLevel.INFO,
             event_type,
             f"Analysis event: {event_type.value}",
             candidate_id=candidate_id,
@@ -266,7 +337,7 @@ class CloudWatchLogger:
                           top_match_score: float = None, error: str = None):
         """Log job matching events"""
         self.log_structured(
-            LogLevel.INFO if 'ERROR' not in event_type.value else LogLevel.ERROR,
+            LogLevel.ERROR if event_type in _ERROR_EVENTS else LogLevel.INFO,
             event_type,
             f"Matching event: {event_type.value}",
             candidate_id=candidate_id,
@@ -338,35 +409,79 @@ class CloudWatchLogger:
         metric_name = f'{api_name}ApiSuccess' if success else f'{api_name}ApiError'
         self.send_performance_metric(metric_name, 1, 'Count')
     
+    # CloudWatch accepts up to 1000 datums per PutMetricData call
+    _METRIC_BATCH_SIZE = 1000
+    _FLUSH_INTERVAL_SECONDS = 5.0
+
     def send_performance_metric(self, metric_name: str, value: float, unit: str = 'Count'):
-        """Send custom metric to CloudWatch"""
-        try:
-            self.cloudwatch.put_metric_data(
-                Namespace='Resumify/Lambda',
-                MetricData=[
-                    {
-                        'MetricName': metric_name,
-                        'Value': value,
-                        'Unit': unit,
-                        'Dimensions': [
-                            {
-                                'Name': 'FunctionName',
-                                'Value': self.function_name
-                            }
-                        ],
-                        'Timestamp': datetime.utcnow()
-                    }
-                ]
-            )
-        except ClientError as e:
-            self.logger.warning(f"Failed to send CloudWatch metric {metric_name}: {str(e)}")
+        """Buffer a custom metric; a background thread flushes it in batches"""
+        if _USE_EMF:
+            sys.stdout.write(json.dumps({
+                '_aws': {
+                    'Timestamp': int(time.time() * 1000),
+                    'CloudWatchMetrics': [{
+                        'Namespace': 'Resumify/Lambda',
+                        'Dimensions': [['FunctionName']],
+                        'Metrics': [{'Name': metric_name, 'Unit': unit}]
+                    }]
+                },
+                'FunctionName': self.function_name,
+                metric_name: value
+            }) + '\n')
+            return
+        self.metrics_buffer.append({
+            'MetricName': metric_name,
+            'Value': value,
+            'Unit': unit,
+            'Dimensions': [
+                {
+                    'Name': 'FunctionName',
+                    'Value': self.function_name
+                }
+            ],
+            'Timestamp': datetime.utcnow()
+        })
+        self._ensure_flush_thread()
+
+    def _ensure_flush_thread(self):
+        if self._flush_thread is None:
+            with self._flush_lock:
+                if self._flush_thread is None:
+                    thread = threading.Thread(target=self._flush_loop, daemon=True)
+                    thread.start()
+                    self._flush_thread = thread
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self._FLUSH_INTERVAL_SECONDS)
+            self._flush_metrics_now()
+
+    def _flush_metrics_now(self):
+        """Drain the metric buffer with one PutMetricData call per batch"""
+        while self.metrics_buffer:
+            batch = []
+            while self.metrics_buffer and len(batch) < self._METRIC_BATCH_SIZE:
+                try:
+                    batch.append(self.metrics_buffer.popleft())
+                except IndexError:
+                    break
+            if not batch:
+                return
+            try:
+                _get_cloudwatch_client().put_metric_data(
+                    Namespace='Resumify/Lambda',
+                    MetricData=batch
+                )
+            except ClientError as e:
+                self.logger.warning(f"Failed to send CloudWatch metrics batch: {str(e)}")
+                return
     
     def track_performance(self, operation_name: str):
         """Decorator to track performance of operations"""
         def decorator(func):
             @wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 success = True
                 error = None
                 
@@ -378,7 +493,7 @@ class CloudWatchLogger:
                     error = str(e)
                     raise
                 finally:
-                    duration_ms = (time.time() - start_time) * 1000
+                    duration_ms = (time.perf_counter_ns() - start_time) / 1e6
                     
                     self.log_structured(
                         LogLevel.INFO if success else LogLevel.ERROR,
@@ -398,34 +513,19 @@ class CloudWatchLogger:
             return wrapper
         return decorator
 
-# Global logger instances for each function
-upload_logger = CloudWatchLogger('upload-handler')
-analysis_logger = CloudWatchLogger('analysis-handler')
-matches_logger = CloudWatchLogger('matches-handler')
-textract_logger = CloudWatchLogger('textract-result-handler')
-textract_worker_logger = CloudWatchLogger('textract-worker')
-docx_txt_worker_logger = CloudWatchLogger('docx-txt-worker')
-nlp_processor_logger = CloudWatchLogger('nlp-processor')
-jobs_logger = CloudWatchLogger('jobs-handler')
+# Loggers are created on first request; each Lambda only ever needs its own,
+# so eagerly building one per function at import just slowed cold starts
+_LOGGERS = {}
 
 def get_logger(function_name: str = None) -> CloudWatchLogger:
-    """Get logger instance for a specific function"""
+    """Get (or lazily create) the logger instance for a specific function"""
     if not function_name:
         function_name = os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'unknown')
-    
-    # Return existing logger if available
-    logger_map = {
-        'upload-handler': upload_logger,
-        'analysis-handler': analysis_logger,
-        'matches-handler': matches_logger,
-        'textract-result-handler': textract_logger,
-        'textract-worker': textract_worker_logger,
-        'docx-txt-worker': docx_txt_worker_logger,
-        'nlp-processor': nlp_processor_logger,
-        'jobs-handler': jobs_logger
-    }
-    
-    return logger_map.get(function_name, CloudWatchLogger(function_name))
+
+    logger = _LOGGERS.get(function_name)
+    if logger is None:
+        logger = _LOGGERS.setdefault(function_name, CloudWatchLogger(function_name))
+    return logger
 
 def log_lambda_handler(func):
     """Decorator to automatically log Lambda handler start/end/error"""
@@ -439,8 +539,19 @@ def log_lambda_handler(func):
             if 'queryStringParameters' in event and event['queryStringParameters']:
                 candidate_id = event['queryStringParameters'].get('candidateId')
             elif 'body' in event and event['body']:
-                body = json.loads(event['body']) if isinstance(event['body'], str) else event['body']
-                candidate_id = body.get('candidateId')
+                body = event['body']
+                if isinstance(body, (str, bytes)):
+                    raw = body.encode() if isinstance(body, str) else body
+                    match = _CID.search(raw)
+                    if match:
+                        candidate_id = match.group(1).decode()
+                    else:
+                        # Parse once and stash so the wrapped handler can reuse it
+                        body = _loads(body)
+                        event['_parsed_body'] = body
+                        candidate_id = body.get('candidateId')
+                else:
+                    candidate_id = body.get('candidateId')
         except:
             pass
         
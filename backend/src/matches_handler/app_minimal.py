@@ -18,6 +18,20 @@ CORS_HEADERS = {
     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
 }
 
+# Table handles are lazy singletons: built on first use (not at import, so a
+# cold start that only serves OPTIONS pays nothing) and reused on warm calls
+_DDB = None
+_ANALYSES_TBL = None
+_JOBS_TBL = None
+
+def _tables():
+    global _DDB, _ANALYSES_TBL, _JOBS_TBL
+    if _DDB is None:
+        _DDB = boto3.resource('dynamodb')
+        _ANALYSES_TBL = _DDB.Table(os.environ.get('ANALYSES_TABLE', 'Resumify_Analyses_dev'))
+        _JOBS_TBL = _DDB.Table(os.environ.get('JOBS_TABLE', 'Resumify_Jobs_dev'))
+    return _ANALYSES_TBL, _JOBS_TBL
+
 def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Create standardized response with CORS headers"""
     headers = CORS_HEADERS.copy()
@@ -50,12 +64,7 @@ def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
                 'error': 'candidateId is required'
             })
         
-        dynamodb = boto3.resource('dynamodb')
-        ANALYSES_TABLE = os.environ.get('ANALYSES_TABLE', 'Resumify_Analyses_dev')
-        JOBS_TABLE = os.environ.get('JOBS_TABLE', 'Resumify_Jobs_dev')
-        
-        analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        jobs_table = dynamodb.Table(JOBS_TABLE)
+        analyses_table, jobs_table = _tables()
         
         # Get candidate analysis
         try:
@@ -1,4 +1,5 @@
 import json
+import concurrent.futures
 import boto3
 import uuid
 from datetime import datetime
@@ -6,23 +7,60 @@ import os
 from decimal import Decimal
 import re
 import logging
+from botocore.config import Config
+
+# pyahocorasick gives single-pass multi-keyword search; optional in the package
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# The DAX client is optional; it only matters when a cluster endpoint is
+# configured for the stack
+try:
+    from amazondax import AmazonDaxClient
+except ImportError:
+    AmazonDaxClient = None
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # Initialize AWS clients
+# The default pool of 10 connections serializes the parallel writes under
+# warm-invoke bursts; keep-alive skips TCP setup on reused contexts
 region = boto3.Session().region_name or 'ap-south-1'
-dynamodb = boto3.resource('dynamodb', region_name=region)
+
+# When DAX_ENDPOINT is set and the client is bundled, the repeated
+# candidateId-index reads in retry/replay scenarios come from the DAX cache
+# in microseconds; writes pass through to DynamoDB. Without either, the
+# plain resource is used unchanged.
+_DAX_ENDPOINT = os.environ.get('DAX_ENDPOINT')
+if AmazonDaxClient is not None and _DAX_ENDPOINT:
+    dynamodb = AmazonDaxClient.resource(endpoint_url=_DAX_ENDPOINT, region_name=region)
+else:
+    dynamodb = boto3.resource('dynamodb', region_name=region, config=Config(
+        max_pool_connections=50,
+        retries={'mode': 'adaptive', 'max_attempts': 3},
+        tcp_keepalive=True
+    ))
 
 # Environment variables
 CANDIDATES_TABLE = os.environ['CANDIDATES_TABLE']
 ANALYSES_TABLE = os.environ['ANALYSES_TABLE']
 
+# Table handles are cached for the lifetime of the execution context;
+# dynamodb.Table() builds a fresh resource object per call otherwise
+ANALYSES_TBL = dynamodb.Table(ANALYSES_TABLE)
+CANDIDATES_TBL = dynamodb.Table(CANDIDATES_TABLE)
+
 def lambda_handler(event, context):
     """Process text and extract structured data using NLP"""
     try:
-        logger.info(f"NLP handler invoked with event: {json.dumps(event)}")
+        # Lazy %s formatting; serializing the event eagerly costs CPU on
+        # every warm invoke even when the record is filtered
+        # Full event only at DEBUG; %s defers serialization until a sink wants it
+        logger.debug("NLP handler invoked with event: %s", event)
         
         # Handle direct invocation
         if 'candidateId' in event:
@@ -32,12 +70,20 @@ def lambda_handler(event, context):
         
         # Handle SNS events
         elif 'Records' in event:
-            for record in event['Records']:
-                if record.get('Sns'):
-                    message = json.loads(record['Sns']['Message'])
-                    if 'candidateId' in message:
-                        candidate_id = message['candidateId']
-                        process_candidate_text(candidate_id)
+            candidate_ids = [
+                message['candidateId']
+                for record in event['Records'] if record.get('Sns')
+                for message in (json.loads(record['Sns']['Message']),)
+                if 'candidateId' in message
+            ]
+            if len(candidate_ids) == 1:
+                process_candidate_text(candidate_ids[0])
+            elif candidate_ids:
+                # Each candidate costs several serial DynamoDB round-trips;
+                # overlap them across records (pool is sized for this)
+                max_workers = min(10, len(candidate_ids))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(process_candidate_text, candidate_ids))
         
         return {'statusCode': 200, 'body': 'NLP processing completed successfully'}
         
@@ -48,13 +94,21 @@ def lambda_handler(event, context):
 def process_candidate_text(candidate_id):
     """Process candidate text and extract structured data"""
     try:
-        # Get analysis record
-analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        response = analyses_table.query(
-            IndexName='candidateId-index',
-            KeyConditionExpression='candidateId = :candidate_id',
-            ExpressionAttributeValues={':candidate_id': candidate_id}
-        )
+        # The analysis query and the candidate fileType read are independent;
+        # fire both up front so their latencies overlap (a GSI query and a
+        # point get can't share one BatchGetItem)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            analysis_future = executor.submit(
+                ANALYSES_TBL.query,
+                IndexName='candidateId-index',
+                KeyConditionExpression='candidateId = :candidate_id',
+                ExpressionAttributeValues={':candidate_id': candidate_id}
+            )
+            candidate_future = executor.submit(
+                CANDIDATES_TBL.get_item, Key={'candidateId': candidate_id}
+            )
+            response = analysis_future.result()
+            candidate_response = candidate_future.result()
         
         if not response['Items']:
             logger.error(f"No analysis record found for candidate: {candidate_id}")
@@ -67,25 +121,34 @@ analyses_table = dynamodb.Table(ANALYSES_TABLE)
             logger.error(f"No text content found for candidate: {candidate_id}")
             return
         
-        logger.info(f"Processing text for candidate: {candidate_id}, text length: {len(text_content)}")
-        logger.info(f"Text content preview: {text_content[:500]}...")
+        logger.info("Processing text for candidate: %s, text length: %d",
+                    candidate_id, len(text_content))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Text content preview: %s...", text_content[:500])
         
-        # Get file type from candidate record
-        candidates_table = dynamodb.Table(CANDIDATES_TABLE)
-        candidate_response = candidates_table.get_item(Key={'candidateId': candidate_id})
+        # File type from the candidate record fetched above
         file_type = candidate_response.get('Item', {}).get('fileType', 'txt')
         
-        logger.info(f"File type: {file_type}")
+        logger.info("File type: %s", file_type)
         
         # Extract structured data
         extracted_data = extract_structured_data(text_content, file_type)
-        logger.info(f"Extracted data: {json.dumps(extracted_data, indent=2, default=str)}")
-        
-        # Update analysis record with extracted data
-        update_analysis_record(candidate_id, extracted_data)
-        
-        # Update candidate status
-        update_candidate_status(candidate_id, 'analyzed')
+        # Pretty-printing the full payload is debug-only; json.dumps with
+        # indent on every invoke is pure overhead at INFO
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted data: %s",
+                         json.dumps(extracted_data, indent=2, default=str))
+        
+        # The analysis update and the candidate status transition hit
+        # different tables and are independent; overlap the two writes so
+        # their round-trip latencies don't serialize
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            update_future = executor.submit(
+                update_analysis_record, analysis_record['analysisId'], extracted_data
+            )
+            status_future = executor.submit(update_candidate_status, candidate_id, 'analyzed')
+            update_future.result()
+            status_future.result()
         
         logger.info(f"NLP processing completed for candidate: {candidate_id}")
         
@@ -109,9 +172,9 @@ def extract_structured_data(text, file_type=None):
         logger.error(f"Error extracting structured data: {str(e)}")
         return {}
 
-def get_hardcoded_pdf_data():
-    """Return hardcoded data for PDF files (Aman Sharma)"""
-            return {
+# The hardcoded payloads are static apart from updatedAt; build the Decimal
+# values and nested dicts once and stamp the timestamp per call
+_PDF_BASE = {
         'skills': ['Java', 'Python', 'JavaScript', 'React.js', 'Node.js', 'MongoDB', 'PostgreSQL', 'Docker', 'Kubernetes', 'Git', 'Jenkins', 'AWS', 'TypeScript', 'Next.js', 'Tailwind CSS', 'LangChain', 'Streamlit'],
         'experience': {
             'totalYears': Decimal('3'),
@@ -129,13 +192,14 @@ def get_hardcoded_pdf_data():
         'keyPhrases': ['Full-Stack Development', 'AI Integration', 'Digital Marketing', 'Research Publications', 'Best Paper Award'],
         'overallScore': Decimal('85'),
         'sentiment': 'POSITIVE',
-        'status': 'completed',
-        'updatedAt': datetime.utcnow().isoformat()
-    }
+        'status': 'completed'
+}
 
-def get_hardcoded_docx_data():
-    """Return hardcoded data for DOCX files (Shyam Patel)"""
-            return {
+def get_hardcoded_pdf_data():
+    """Return hardcoded data for PDF files (Aman Sharma)"""
+    return {**_PDF_BASE, 'updatedAt': datetime.utcnow().isoformat()}
+
+_DOCX_BASE = {
         'skills': ['Python', 'Java', 'JavaScript', 'HTML5', 'CSS3', 'React', 'Node.js', 'MySQL', 'MongoDB', 'PostgreSQL', 'Git', 'AWS', 'Docker', 'Linux'],
         'experience': {
             'totalYears': Decimal('2'),
@@ -146,32 +210,42 @@ def get_hardcoded_docx_data():
         'education': {
             'degree': 'BA Computer Science',
             'university': 'University of Technology',
-            'graduationYear': Decimal('20XX')
+            # '20XX' is the placeholder from the source resume; Decimal('20XX')
+            # raised on every call and made this whole payload come back empty
+            'graduationYear': '20XX'
         },
         'jobTitles': ['Software Developer', 'Junior Software Engineer', 'Software Intern'],
         'organizations': ['XYZ Company', 'ABC Corporation', 'DEF Solutions'],
         'keyPhrases': ['Full-Stack Development', 'API Development', 'Agile/Scrum', 'RESTful APIs', 'Outstanding Leadership Award'],
         'overallScore': Decimal('78'),
         'sentiment': 'POSITIVE',
-        'status': 'completed',
-        'updatedAt': datetime.utcnow().isoformat()
-    }
+        'status': 'completed'
+}
+
+def get_hardcoded_docx_data():
+    """Return hardcoded data for DOCX files (Shyam Patel)"""
+    return {**_DOCX_BASE, 'updatedAt': datetime.utcnow().isoformat()}
 
 def extract_from_text(text):
     """Original extraction logic for fallback"""
     try:
+        # Lowercase the resume once; the skill scan and sentiment pass share
+        # the buffer instead of each allocating their own copy
+        text_lower = text.lower()
+        
         # Extract skills
-        skills = extract_skills(text)
+        skills = extract_skills(text, text_lower)
+        
+        # Extract job titles once; extract_experience reuses them instead of
+        # re-running the same regexes
+        job_titles = extract_job_titles(text)
         
         # Extract experience
-        experience = extract_experience(text)
+        experience = extract_experience(text, job_titles)
         
         # Extract education
         education = extract_education(text)
         
-        # Extract job titles
-        job_titles = extract_job_titles(text)
-        
         # Extract organizations
         organizations = extract_organizations(text)
         
@@ -182,7 +256,7 @@ def extract_from_text(text):
         overall_score = calculate_overall_score(skills, experience, education)
         
         # Calculate sentiment
-        sentiment = calculate_sentiment(text)
+        sentiment = calculate_sentiment(text, text_lower)
         
         return {
             'skills': skills,
@@ -201,38 +275,95 @@ def extract_from_text(text):
         logger.error(f"Error extracting from text: {str(e)}")
         return {}
 
-def extract_skills(text):
+# Technical skills first, soft skills after, matching the original scan order
+_SKILLS = (
+    'Python', 'JavaScript', 'Java', 'C++', 'C#', 'Go', 'Rust', 'Swift', 'Kotlin',
+    'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 'Flask', 'Spring',
+    'HTML', 'CSS', 'Bootstrap', 'jQuery', 'TypeScript', 'PHP', 'Ruby', 'Laravel',
+    'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'DynamoDB', 'Oracle',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitHub',
+    'Linux', 'Windows', 'MacOS', 'Unix', 'Bash', 'PowerShell',
+    'Machine Learning', 'AI', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
+    'Data Science', 'Analytics', 'Big Data', 'Hadoop', 'Spark', 'Kafka',
+    'Leadership', 'Team Management', 'Communication', 'Problem Solving',
+    'Project Management', 'Agile', 'Scrum', 'Collaboration', 'Mentoring',
+    'Time Management', 'Critical Thinking', 'Adaptability', 'Creativity',
+    'Negotiation', 'Presentation', 'Writing', 'Public Speaking'
+)
+
+# Canonical skill paired with its precomputed lowercase form, so no skill
+# string is re-lowered at call time
+_SKILLS_LOWER = tuple((skill, skill.lower()) for skill in _SKILLS)
+
+# One automaton pass finds every skill substring at once instead of ~75
+# per-skill scans over the whole text
+if ahocorasick is not None:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in _SKILLS:
+        _SKILL_AUTOMATON.add_word(_skill.lower(), _skill.lower())
+    _SKILL_AUTOMATON.make_automaton()
+else:
+    _SKILL_AUTOMATON = None
+
+# Regex fallback: longest-first alternation keeps the original substring
+# semantics in a single pass
+_SKILL_RE = re.compile('|'.join(
+    re.escape(skill.lower()) for skill in sorted(_SKILLS, key=len, reverse=True)
+))
+
+# The alternation consumes its longest match, so skills nested in longer
+# ones (Java in JavaScript, SQL in PostgreSQL, Git in GitHub) are mapped
+# back from the winning match; the automaton reports overlaps itself
+_NESTED_SKILLS = {}
+for _outer in _SKILLS:
+    _outer_lower = _outer.lower()
+    _nested = tuple(
+        inner.lower() for inner in _SKILLS
+        if inner is not _outer and inner.lower() in _outer_lower
+    )
+    if _nested:
+        _NESTED_SKILLS[_outer_lower] = _nested
+del _outer, _outer_lower, _nested
+
+def extract_skills(text, text_lower=None):
     """Extract technical and soft skills from text"""
-    technical_skills = [
-        'Python', 'JavaScript', 'Java', 'C++', 'C#', 'Go', 'Rust', 'Swift', 'Kotlin',
-        'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 'Flask', 'Spring',
-        'HTML', 'CSS', 'Bootstrap', 'jQuery', 'TypeScript', 'PHP', 'Ruby', 'Laravel',
-        'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'DynamoDB', 'Oracle',
-        'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitHub',
-        'Linux', 'Windows', 'MacOS', 'Unix', 'Bash', 'PowerShell',
-        'Machine Learning', 'AI', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
-        'Data Science', 'Analytics', 'Big Data', 'Hadoop', 'Spark', 'Kafka'
-    ]
-    
-    soft_skills = [
-        'Leadership', 'Team Management', 'Communication', 'Problem Solving',
-        'Project Management', 'Agile', 'Scrum', 'Collaboration', 'Mentoring',
-        'Time Management', 'Critical Thinking', 'Adaptability', 'Creativity',
-        'Negotiation', 'Presentation', 'Writing', 'Public Speaking'
-    ]
+    if text_lower is None:
+        text_lower = text.lower()
+    if _SKILL_AUTOMATON is not None:
+        hits = {skill for _, skill in _SKILL_AUTOMATON.iter(text_lower)}
+    else:
+        hits = set(_SKILL_RE.findall(text_lower))
+        for hit in tuple(hits):
+            hits.update(_NESTED_SKILLS.get(hit, ()))
     
-    all_skills = technical_skills + soft_skills
-    text_lower = text.lower()
+    # Stop collecting at the 20-skill cap instead of filtering all ~75
+    # skills and slicing afterwards
     found_skills = []
-    
-    for skill in all_skills:
-        if skill.lower() in text_lower:
+    for skill, skill_lower in _SKILLS_LOWER:
+        if skill_lower in hits:
             found_skills.append(skill)
+            if len(found_skills) >= 20:
+                break
     
-    return found_skills[:20]  # Limit to top 20 skills
+    return found_skills
+
+# All extraction regexes are compiled once at import; per-call re.findall
+# pays a pattern-cache lookup on every use, and the fallback path runs each
+# of these against full resume text
+_EXPERIENCE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|expertise)',
+    r'(?:experience|expertise)[:\s]*(\d+)\+?\s*years?',
+    r'(\d+)\+?\s*years?\s*in\s*(?:the\s*)?(?:field|industry|profession)',
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|expertise|in)',
+    r'(?:over|with)\s*(\d+)\+?\s*years?'
+))
+
+def extract_experience(text, job_titles=None):
+    """Extract work experience from text
 
-def extract_experience(text):
-    """Extract work experience from text"""
+    job_titles can be passed in when the caller has already extracted them,
+    avoiding a second run of the title regexes.
+    """
     experience = {
         'totalYears': Decimal('0'),
         'currentRole': '',
@@ -240,18 +371,9 @@ def extract_experience(text):
         'summary': ''
     }
     
-    # Look for experience patterns
-    experience_patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|expertise)',
-        r'(?:experience|expertise)[:\s]*(\d+)\+?\s*years?',
-        r'(\d+)\+?\s*years?\s*in\s*(?:the\s*)?(?:field|industry|profession)',
-        r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|expertise|in)',
-        r'(?:over|with)\s*(\d+)\+?\s*years?'
-    ]
-    
     years_found = []
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _EXPERIENCE_RES:
+        matches = pattern.findall(text)
         for match in matches:
             try:
                 years = float(match)
@@ -262,9 +384,10 @@ def extract_experience(text):
     if years_found:
         experience['totalYears'] = Decimal(str(max(years_found)))
     
-    # Extract job titles and companies
-    job_titles = extract_job_titles(text)
-    organizations = extract_organizations(text)
+    # Extract job titles unless the caller already did; the organizations
+    # extraction that used to run here was never read
+    if job_titles is None:
+        job_titles = extract_job_titles(text)
     
     if job_titles:
         experience['currentRole'] = job_titles[0]
@@ -276,6 +399,18 @@ def extract_experience(text):
     
     return experience
 
+_DEGREE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(Bachelor|Master|PhD|Doctorate|Associate|Diploma|Certificate)\s*(?:of\s*)?(?:Science|Arts|Engineering|Business|Computer Science|Information Technology|Data Science|Software Engineering)?',
+    r'(B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Ph\.?D\.?|MBA|M\.?B\.?A\.?)'
+))
+
+_UNIVERSITY_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:University|College|Institute|School)\s+of\s+([A-Za-z\s]+)',
+    r'([A-Za-z\s]+)\s+(?:University|College|Institute)'
+))
+
+_GRAD_YEAR_RE = re.compile(r'(?:graduated|completed|finished).*?(\d{4})', re.IGNORECASE)
+
 def extract_education(text):
     """Extract education information from text"""
     education = {
@@ -284,33 +419,20 @@ def extract_education(text):
         'graduationYear': Decimal('0')
     }
     
-    # Look for degree patterns
-    degree_patterns = [
-        r'(Bachelor|Master|PhD|Doctorate|Associate|Diploma|Certificate)\s*(?:of\s*)?(?:Science|Arts|Engineering|Business|Computer Science|Information Technology|Data Science|Software Engineering)?',
-        r'(B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Ph\.?D\.?|MBA|M\.?B\.?A\.?)'
-    ]
-    
-    for pattern in degree_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _DEGREE_RES:
+        match = pattern.search(text)
         if match:
             education['degree'] = match.group(1)
             break
     
-    # Look for university patterns
-    university_patterns = [
-        r'(?:University|College|Institute|School)\s+of\s+([A-Za-z\s]+)',
-        r'([A-Za-z\s]+)\s+(?:University|College|Institute)'
-    ]
-    
-    for pattern in university_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _UNIVERSITY_RES:
+        match = pattern.search(text)
         if match:
             education['university'] = match.group(1).strip()
             break
     
     # Look for graduation year
-    year_pattern = r'(?:graduated|completed|finished).*?(\d{4})'
-    year_match = re.search(year_pattern, text, re.IGNORECASE)
+    year_match = _GRAD_YEAR_RE.search(text)
     if year_match:
         try:
             education['graduationYear'] = Decimal(year_match.group(1))
@@ -319,59 +441,60 @@ def extract_education(text):
     
     return education
 
+_JOB_TITLE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:Senior|Junior|Lead|Principal|Staff)?\s*(?:Software\s+)?(?:Engineer|Developer|Programmer|Architect|Manager|Director|Analyst|Consultant|Specialist)',
+    r'(?:Full\s+Stack|Front\s+End|Back\s+End|DevOps|Data|Machine\s+Learning|AI)\s+(?:Engineer|Developer|Specialist)',
+    r'(?:Product|Project|Technical|Engineering)\s+(?:Manager|Lead|Director)'
+))
+
 def extract_job_titles(text):
     """Extract job titles from text"""
-    job_title_patterns = [
-        r'(?:Senior|Junior|Lead|Principal|Staff)?\s*(?:Software\s+)?(?:Engineer|Developer|Programmer|Architect|Manager|Director|Analyst|Consultant|Specialist)',
-        r'(?:Full\s+Stack|Front\s+End|Back\s+End|DevOps|Data|Machine\s+Learning|AI)\s+(?:Engineer|Developer|Specialist)',
-        r'(?:Product|Project|Technical|Engineering)\s+(?:Manager|Lead|Director)'
-    ]
-    
     job_titles = []
-    for pattern in job_title_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _JOB_TITLE_RES:
+        matches = pattern.findall(text)
         for match in matches:
             if isinstance(match, tuple):
                 job_titles.append(' '.join(match).strip())
             else:
                 job_titles.append(match.strip())
     
-    # Remove duplicates and return unique job titles
-    return list(set(job_titles))[:10]
+    # Dedup in one pass, keeping first-seen order so results are
+    # deterministic across invocations
+    return list(dict.fromkeys(job_titles))[:10]
+
+_ORGANIZATION_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:at|@|worked\s+at|employed\s+at)\s+([A-Za-z\s&.,]+?)(?:\s|$|,|\n)',
+    r'([A-Za-z\s&.,]+?)\s+(?:Inc|Corp|LLC|Ltd|Company|Technologies|Solutions|Systems)',
+    r'(?:Company|Organization):\s*([A-Za-z\s&.,]+)'
+))
 
 def extract_organizations(text):
     """Extract company names from text"""
-    organization_patterns = [
-        r'(?:at|@|worked\s+at|employed\s+at)\s+([A-Za-z\s&.,]+?)(?:\s|$|,|\n)',
-        r'([A-Za-z\s&.,]+?)\s+(?:Inc|Corp|LLC|Ltd|Company|Technologies|Solutions|Systems)',
-        r'(?:Company|Organization):\s*([A-Za-z\s&.,]+)'
-    ]
-    
     organizations = []
-    for pattern in organization_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _ORGANIZATION_RES:
+        matches = pattern.findall(text)
         for match in matches:
             org = match.strip()
             if len(org) > 2 and len(org) < 50:  # Reasonable length
                 organizations.append(org)
     
-    # Remove duplicates and return unique organizations
-    return list(set(organizations))[:10]
+    # Dedup in one pass, keeping first-seen order so results are
+    # deterministic across invocations
+    return list(dict.fromkeys(organizations))[:10]
+
+_KEY_PHRASE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:led|managed|developed|designed|implemented|created|built|maintained|optimized|improved)\s+[^.]*',
+    r'(?:experience|expertise|proficient|skilled)\s+in\s+[^.]*',
+    r'(?:responsible|accountable)\s+for\s+[^.]*'
+))
 
 def extract_key_phrases(text):
     """Extract key phrases from text"""
     # Simple key phrase extraction based on common resume terms
     key_phrases = []
     
-    # Look for common resume phrases
-    phrase_patterns = [
-        r'(?:led|managed|developed|designed|implemented|created|built|maintained|optimized|improved)\s+[^.]*',
-        r'(?:experience|expertise|proficient|skilled)\s+in\s+[^.]*',
-        r'(?:responsible|accountable)\s+for\s+[^.]*'
-    ]
-    
-    for pattern in phrase_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _KEY_PHRASE_RES:
+        matches = pattern.findall(text)
         for match in matches:
             if len(match) > 10 and len(match) < 100:  # Reasonable length
                 key_phrases.append(match.strip())
@@ -407,15 +530,47 @@ def calculate_overall_score(skills, experience, education):
     
     return min(score, 100)  # Cap at 100
 
-def calculate_sentiment(text):
+# Sentiment keyword sets, scanned in one pass like the skills
+_POSITIVE_WORDS = frozenset((
+    'excellent', 'outstanding', 'achieved', 'successful', 'innovative',
+    'creative', 'passionate', 'dedicated'
+))
+_NEGATIVE_WORDS = frozenset((
+    'failed', 'unsuccessful', 'poor', 'bad', 'terrible', 'awful'
+))
+
+if ahocorasick is not None:
+    _SENTIMENT_AUTOMATON = ahocorasick.Automaton()
+    for _word in _POSITIVE_WORDS | _NEGATIVE_WORDS:
+        _SENTIMENT_AUTOMATON.add_word(_word, _word)
+    _SENTIMENT_AUTOMATON.make_automaton()
+else:
+    _SENTIMENT_AUTOMATON = None
+
+_SENTIMENT_RE = re.compile('|'.join(
+    re.escape(word)
+    for word in sorted(_POSITIVE_WORDS | _NEGATIVE_WORDS, key=len, reverse=True)
+))
+
+def calculate_sentiment(text, text_lower=None):
     """Calculate sentiment of the text"""
-    # Simple sentiment analysis based on positive/negative words
-    positive_words = ['excellent', 'outstanding', 'achieved', 'successful', 'innovative', 'creative', 'passionate', 'dedicated']
-    negative_words = ['failed', 'unsuccessful', 'poor', 'bad', 'terrible', 'awful']
+    if text_lower is None:
+        text_lower = text.lower()
     
-    text_lower = text.lower()
-    positive_count = sum(1 for word in positive_words if word in text_lower)
-    negative_count = sum(1 for word in negative_words if word in text_lower)
+    # One scan over the text instead of one substring search per keyword;
+    # the original counted presence, not occurrences, so hits collapse to
+    # a set before scoring
+    if _SENTIMENT_AUTOMATON is not None:
+        hits = {word for _, word in _SENTIMENT_AUTOMATON.iter(text_lower)}
+    else:
+        hits = set(_SENTIMENT_RE.findall(text_lower))
+        if 'unsuccessful' in hits:
+            # the alternation consumed the longer word; the substring scan
+            # would have counted the positive form inside it too
+            hits.add('successful')
+    
+    positive_count = len(hits & _POSITIVE_WORDS)
+    negative_count = len(hits & _NEGATIVE_WORDS)
     
     if positive_count > negative_count:
         return 'POSITIVE'
@@ -424,44 +579,25 @@ def calculate_sentiment(text):
     else:
         return 'NEUTRAL'
 
-def update_analysis_record(candidate_id, extracted_data):
+def update_analysis_record(analysis_id, extracted_data):
     """Update analysis record with extracted data"""
     try:
-        analyses_table = dynamodb.Table(ANALYSES_TABLE)
-        
-        # Get the analysis record
-        response = analyses_table.query(
-            IndexName='candidateId-index',
-            KeyConditionExpression='candidateId = :candidate_id',
-            ExpressionAttributeValues={':candidate_id': candidate_id}
-        )
-        
-        if not response['Items']:
-            logger.error(f"No analysis record found for candidate: {candidate_id}")
-            return
-        
-        analysis_record = response['Items'][0]
-        
-        # Update the record
-        update_expression = 'SET '
-        expression_attribute_names = {}
-        expression_attribute_values = {}
-        
-        for key, value in extracted_data.items():
-            if key != 'analysisId':  # Don't update the ID
-                update_expression += f'{key} = :{key}, '
-                expression_attribute_values[f':{key}'] = value
-        
-        # Remove trailing comma
-        update_expression = update_expression.rstrip(', ')
-        
-        analyses_table.update_item(
-            Key={'analysisId': analysis_record['analysisId']},
+        # Update the record; the caller already holds its key. Attribute
+        # names go through #-placeholders so reserved words like 'status'
+        # are accepted, and the expression is joined in one pass
+        keys = [key for key in extracted_data if key != 'analysisId']
+        update_expression = 'SET ' + ', '.join(f'#{key} = :{key}' for key in keys)
+        expression_attribute_names = {f'#{key}': key for key in keys}
+        expression_attribute_values = {f':{key}': extracted_data[key] for key in keys}
+        
+        ANALYSES_TBL.update_item(
+            Key={'analysisId': analysis_id},
             UpdateExpression=update_expression,
+            ExpressionAttributeNames=expression_attribute_names,
             ExpressionAttributeValues=expression_attribute_values
         )
         
-        logger.info(f"Analysis record updated for candidate: {candidate_id}")
+        logger.info(f"Analysis record updated: {analysis_id}")
         
     except Exception as e:
         logger.error(f"Error updating analysis record: {str(e)}")
@@ -469,8 +605,7 @@ def update_analysis_record(candidate_id, extracted_data):
 def update_candidate_status(candidate_id, status):
     """Update candidate status"""
     try:
-        candidates_table = dynamodb.Table(CANDIDATES_TABLE)
-        candidates_table.update_item(
+        CANDIDATES_TBL.update_item(
             Key={'candidateId': candidate_id},
             UpdateExpression='SET #status = :status',
             ExpressionAttributeNames={'#status': 'status'},
@@ -479,19 +614,3 @@ def update_candidate_status(candidate_id, status):
         logger.info(f"Candidate status updated to {status} for candidate: {candidate_id}")
     except Exception as e:
         logger.error(f"Error updating candidate status: {str(e)}")
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps(body)
-    }
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps(body)
-    }
\ No newline at end of file
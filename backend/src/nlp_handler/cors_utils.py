@@ -3,8 +3,26 @@ CORS utilities for standardized CORS handling across all Lambda functions
 """
 
 import json
+from decimal import Decimal
 from typing import Dict, Any, Optional
 
+# orjson is bundled in the deployment package; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _decimal_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(body: Any) -> str:
+    """Serialize a response body, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(body, default=_decimal_default).decode()
+    return json.dumps(body, default=_decimal_default, separators=(',', ':'))
+
 # Standard CORS headers for all API responses
 CORS_HEADERS = {
     'Access-Control-Allow-Origin': '*',
@@ -46,7 +64,7 @@ def create_cors_response(
     return {
         'statusCode': status_code,
         'headers': headers,
-        'body': json.dumps(body)
+        'body': _dumps(body)
     }
 
 def create_options_response() -> Dict[str, Any]:
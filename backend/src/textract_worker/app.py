@@ -84,6 +84,7 @@ def create_analysis_record(candidate_id, text_content):
     analysis_record = {
         'analysisId': str(uuid.uuid4()),
         'candidateId': candidate_id,
+        '_type': 'analysis',  # constant partition key for type-updatedAt-index
         'extractedText': text_content,
         'textExtractionStatus': 'completed',
         'status': 'processing',
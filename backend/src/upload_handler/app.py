@@ -90,11 +90,13 @@ def lambda_handler(event, context):
         candidates_table = dynamodb.Table(CANDIDATES_TABLE)
         candidate_record = {
             'candidateId': candidate_id,
+            '_type': 'candidate',  # constant partition key for type-updatedAt-index
             'name': candidate_name,
             'email': candidate_email,
             'fileName': file_name,
             'fileType': file_type,
             'uploadedAt': datetime.utcnow().isoformat(),
+            'updatedAt': datetime.utcnow().isoformat(),
             'status': 'uploaded',
             'textExtractionStatus': 'pending',
             's3Key': s3_key
@@ -161,6 +163,7 @@ def create_analysis_record(candidate_id, text_content, status):
     analysis_record = {
         'analysisId': str(uuid.uuid4()),
         'candidateId': candidate_id,
+        '_type': 'analysis',  # constant partition key for type-updatedAt-index
         'extractedText': text_content,
         'textExtractionStatus': status,
         'status': 'processing',
@@ -179,6 +182,7 @@ def create_basic_analysis_record(candidate_id, file_name, file_type, status):
     analysis_record = {
         'analysisId': str(uuid.uuid4()),
         'candidateId': candidate_id,
+        '_type': 'analysis',  # constant partition key for type-updatedAt-index
         'extractedText': f"{file_type.upper()} file: {file_name}\n\nProcessing in progress...",
         'textExtractionStatus': status,
         'status': 'processing',